@@ -3681,7 +3681,7 @@ class Client(BasicClient):
 
         self.status = status
         self.away = away
-        self.party.update_presence()
+        self.party.update_presence(force=True)
 
     async def send_presence(self, status: Union[str, dict], *,
                             away: AwayStatus = AwayStatus.ONLINE,
@@ -3711,6 +3711,11 @@ class Client(BasicClient):
             to=to
         )
 
+        # The presence sent to everyone overrides the party presence so it
+        # has to be sent again on the next update.
+        if to is None and self.party is not None:
+            self.party._last_presence_state = None
+
     async def set_platform(self, platform: Platform) -> None:
         """|coro|
 
@@ -22,16 +22,19 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import json
 import asyncio
+import copy
 import aioxmpp
-import re
 import functools
+import inspect
+import itertools
+import operator
 import datetime
+import types
 
 from typing import (TYPE_CHECKING, Iterable, Optional, Any, List, Dict, Union,
                     Tuple, Awaitable, Type)
-from collections import OrderedDict
+from collections import deque
 
 from .enums import Enum, Region
 from .errors import PartyError, Forbidden, HTTPException, NotFound
@@ -39,12 +42,189 @@ from .user import User
 from .friend import Friend
 from .enums import (PartyPrivacy, PartyDiscoverability, PartyJoinability,
                     DefaultCharactersChapter3, Region, ReadyState, Platform)
-from .utils import MaybeLock, to_iso, from_iso
+from .utils import MaybeLock, to_iso, from_iso, json_dumps, json_loads
 
 if TYPE_CHECKING:
     from .client import Client
 
 
+_utcnow = datetime.datetime.utcnow
+
+
+def _encode_bool(value: Any) -> str:
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    return str(value).lower()
+
+
+def _decode_bool(value: Any) -> bool:
+    return not (value is None or (isinstance(value, str)
+                and value.lower() == 'false'))
+
+
+def _decode_int(value: Any) -> int:
+    return 0 if value is None else int(value)
+
+
+def _decode_str(value: Any) -> str:
+    return '' if value is None else str(value)
+
+
+def _copy_json(value: Any) -> Any:
+    # Decoded json only consists of dicts, lists and immutable scalars which
+    # makes this a lot faster than copy.deepcopy().
+    cls = type(value)
+    if cls is dict:
+        return {k: _copy_json(v) for k, v in value.items()}
+    if cls is list:
+        return [_copy_json(v) for v in value]
+    return value
+
+
+# Maps the type suffix of a meta property (e.g. the ``j`` in
+# ``Default:LobbyState_j``) to the callable used to encode/decode its value.
+# Json props are decoded directly in MetaBase.get_prop since their decoded
+# values are cached.
+_ENCODERS = {
+    'j': json_dumps,
+    'b': _encode_bool,
+    'U': int,
+}
+
+_DECODERS = {
+    'b': _decode_bool,
+    'U': _decode_int,
+}
+
+
+_COROUTINE_FLAGS = inspect.CO_COROUTINE | inspect.CO_ITERABLE_COROUTINE
+
+
+def _is_coroutine_function(func: Any) -> bool:
+    # Checking the code flags directly is a lot cheaper than
+    # asyncio.iscoroutinefunction() which is only used as a fallback for
+    # objects without a code object or legacy generator based coroutines.
+    code = getattr(func, '__code__', None)
+    if code is not None and code.co_flags & _COROUTINE_FLAGS:
+        return True
+
+    return asyncio.iscoroutinefunction(func)
+
+
+# Members mostly have the same handful of assets equipped and the properties
+# using this are read often, so the results are cached by the raw asset path.
+@functools.lru_cache(maxsize=512)
+def _get_asset_id(asset: str) -> Optional[str]:
+    # Returns the id at the end of an asset path, e.g. the BID_001 in
+    # /Game/Athena/Items/Cosmetics/Backpacks/BID_001.BID_001.
+    _, sep, asset_id = asset.strip("'").rpartition('.')
+    if not sep:
+        return None
+
+    asset_id = asset_id.split("'", 1)[0].split('"', 1)[0]
+    if asset_id != 'None':
+        return asset_id
+
+
+# The backpack slot holds either a backpack or a pet. Returns the id as a
+# (backpack, pet) tuple.
+@functools.lru_cache(maxsize=512)
+def _get_backpack_and_pet(asset: str) -> Tuple[Optional[str], Optional[str]]:
+    if '/petcarriers/' in asset.lower():
+        return None, _get_asset_id(asset)
+
+    return _get_asset_id(asset), None
+
+
+# Looking up enum members by value goes through EnumMeta.__call__ which is
+# slow compared to a cache hit.
+_get_platform = functools.lru_cache(maxsize=32)(Platform)
+_get_ready_state = functools.lru_cache(maxsize=32)(ReadyState)
+
+# Scratchpad entries are stored as {'t': <channel>, 'v': <value>}.
+_get_enlightenment = operator.itemgetter('t', 'v')
+
+# Members in the same match share their start time and the property using
+# this is read often, so the parsed datetimes are cached by the raw string.
+_match_started_at_from_iso = functools.lru_cache(maxsize=128)(from_iso)
+
+
+# Default backend names of the PartyMemberBase.create_variant() kwargs.
+_VARIANT_CONFIG = types.MappingProxyType({
+    'pattern': 'Mat{}',
+    'numeric': 'Numeric.{}',
+    'clothing_color': 'Mat{}',
+    'jersey_color': 'Color.{}',
+    'parts': 'Stage{}',
+    'progressive': 'Stage{}',
+    'particle': 'Emissive{}',
+    'material': 'Mat{}',
+    'emissive': 'Emissive{}',
+    'profile_banner': '{}',
+})
+
+# Channel names of the PartyMemberBase.create_variant() kwargs,
+# e.g. jersey_color -> JerseyColor.
+_VARIANT_CHANNEL_NAMES = {
+    'pattern': 'Pattern',
+    'numeric': 'Numeric',
+    'clothing_color': 'ClothingColor',
+    'jersey_color': 'JerseyColor',
+    'parts': 'Parts',
+    'progressive': 'Progressive',
+    'particle': 'Particle',
+    'material': 'Material',
+    'emissive': 'Emissive',
+    'profile_banner': 'ProfileBanner',
+}
+
+
+# Directories of the cosmetic asset types that can be set by their id alone.
+_BACKPACK_PATH = '/BRCosmetics/Athena/Items/Cosmetics/Backpacks/'
+_PET_PATH = '/BRCosmetics/Athena/Items/Cosmetics/PetCarriers/'
+_PICKAXE_PATH = '/BRCosmetics/Athena/Items/Cosmetics/PickAxes/'
+_CONTRAIL_PATH = '/BRCosmetics/Athena/Items/Cosmetics/Contrails/'
+_KICKS_PATH = '/CosmeticShoes/Assets/Items/Cosmetics/'
+_EMOTE_PATH = '/BRCosmetics/Athena/Items/Cosmetics/Dances/'
+_EMOJI_PATH = '/BRCosmetics/Athena/Items/Cosmetics/Dances/Emoji/'
+_JAM_EMOTE_PATH = '/SparksSongTemplates/Items/JamEmotes/'
+
+# Outfits are referenced by their primary asset id instead of a path.
+_CHARACTER_PREFIX = 'AthenaCharacter:'
+
+
+def _asset_path(directory: str, asset: str) -> str:
+    return f'{directory}{asset}.{asset}'
+
+
+def _is_unchanged(new: Iterable[Any], current: Iterable[Any]) -> bool:
+    # None means "keep the current value" for the partial meta setters.
+    return all(n is None or n == c for n, c in zip(new, current))
+
+
+# Variant prepended to outfit and backpack variants when corruption is set.
+_CORRUPTION_VARIANT = {'c': 'Corruption', 'v': 'FloatSlider', 'dE': 1}
+
+# slot -> (set_cosmetic_loadout kwarg, asset id resolver, meta property of
+# the current asset, variants slot, whether corruption is supported)
+_COSMETIC_SLOTS = types.MappingProxyType({
+    'outfit': ('character', _CHARACTER_PREFIX.__add__,
+               'outfit', 'AthenaCharacter', True),
+    'backpack': ('backpack', functools.partial(_asset_path, _BACKPACK_PATH),
+                 'backpack', 'AthenaBackpack', True),
+    'pet': ('backpack', functools.partial(_asset_path, _PET_PATH),
+            'backpack', 'AthenaBackpack', False),
+    'pickaxe': ('pickaxe', functools.partial(_asset_path, _PICKAXE_PATH),
+                'pickaxe', 'AthenaPickaxe', False),
+    'contrail': ('contrail', functools.partial(_asset_path, _CONTRAIL_PATH),
+                 'contrail', 'AthenaContrail', False),
+    'kicks': ('shoes', functools.partial(_asset_path, _KICKS_PATH),
+              'kicks', None, False),
+})
+
+
 class SquadAssignment:
     """Represents a party members squad assignment. A squad assignment
     is basically a piece of information about which position a member
@@ -77,14 +257,21 @@ class SquadAssignment:
         return ('<SquadAssignment position={0.position!r} '
                 'hidden={0.hidden!r}>'.format(self))
 
+    def __copy__(self) -> 'SquadAssignment':
+        cls = type(self)
+        new = cls.__new__(cls)
+
+        new.position = self.position
+        new.hidden = self.hidden
+
+        return new
+
     @classmethod
     def copy(cls, assignment: 'SquadAssignment') -> 'SquadAssignment':
-        self = cls.__new__(cls)
+        return assignment.__copy__()
 
-        self.position = assignment.position
-        self.hidden = assignment.hidden
 
-        return self
+_POSITION_SET = frozenset(range(16))
 
 
 class DefaultPartyConfig:
@@ -181,6 +368,12 @@ class DefaultPartyConfig:
     cls: Type[:class:`ClientParty`]
         The default party object used to represent the client's party.
     """  # noqa
+
+    # Maps the qualname of a meta coroutine to a hook that is called with the
+    # partials args whenever the coroutine is added to the default meta.
+    # Populated after ClientParty is defined.
+    _META_HOOKS = {}
+
     def __init__(self, **kwargs: Any) -> None:
         self.cls = kwargs.pop('cls', ClientParty)
         self._client = None
@@ -217,13 +410,9 @@ class DefaultPartyConfig:
                 'ranging from 0-16.'
             )
 
-        if len(value) != 16:
+        if len(value) != 16 or frozenset(value) != _POSITION_SET:
             error()
 
-        for i in range(16):
-            if i not in value:
-                error()
-
         self._position_priorities = value
 
     def _inject_client(self, client: 'Client') -> None:
@@ -248,13 +437,12 @@ class DefaultPartyConfig:
             'type': 'DEFAULT',
         }
 
-        to_update = {}
-        for key, value in config.items():
-            if isinstance(value, Enum):
-                to_update[key] = value.value
-
-        default_config = {**default, **self._config}
-        self._config = {**default_config, **config, **to_update}
+        self._config = {
+            **default,
+            **self._config,
+            **{k: v.value if isinstance(v, Enum) else v
+               for k, v in config.items()},
+        }
 
     def _update_privacy(self, args: list) -> None:
         for arg in args:
@@ -274,29 +462,25 @@ class DefaultPartyConfig:
                 break
 
     def update_meta(self, meta: List[functools.partial]) -> None:
-        names = []
-        results = []
+        results = {}
 
-        unfiltered = [*meta[::-1], *self.meta[::-1]]
+        unfiltered = itertools.chain(reversed(meta), reversed(self.meta))
         for elem in unfiltered:
             coro = elem.func
+            name = coro.__qualname__
 
-            if coro.__qualname__ not in names:
-                # Very hacky solution but its needed to update the privacy
-                # in .config since updating privacy doesnt work as expected
-                # when updating with an "all patch" strategy like other props.
-                if coro.__qualname__ == 'ClientParty.set_privacy':
-                    self._update_privacy(elem.args)
+            if name not in results:
+                hook = self._META_HOOKS.get(name)
+                if hook is not None:
+                    hook(self, elem.args)
 
-                names.append(coro.__qualname__)
-                results.append(elem)
+                results[name] = elem
 
-            if not (asyncio.iscoroutine(coro)
-                    or asyncio.iscoroutinefunction(coro)):
+            if not _is_coroutine_function(coro):
                 raise TypeError('meta must be list containing partials '
                                 'of coroutines')
 
-        self.meta = results
+        self.meta = list(results.values())
 
 
 class DefaultPartyMemberConfig:
@@ -351,25 +535,23 @@ class DefaultPartyMemberConfig:
         self.meta = kwargs.get('meta', [])
 
     def update_meta(self, meta: List[functools.partial]) -> None:
-        names = []
-        results = []
+        results = {}
 
-        unfiltered = [*meta[::-1], *self.meta[::-1]]
+        unfiltered = itertools.chain(reversed(meta), reversed(self.meta))
         for elem in unfiltered:
             coro = elem.func
-            if coro.__qualname__ not in names:
-                names.append(coro.__qualname__)
-                results.append(elem)
+            results.setdefault(coro.__qualname__, elem)
 
-            if not (asyncio.iscoroutine(coro)
-                    or asyncio.iscoroutinefunction(coro)):
+            if not _is_coroutine_function(coro):
                 raise TypeError('meta must be list containing partials '
                                 'of coroutines')
 
-        self.meta = results
+        self.meta = list(results.values())
 
 
 class Patchable:
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
@@ -386,74 +568,158 @@ class Patchable:
                     deleted: Optional[list] = None,
                     overridden: Optional[dict] = None,
                     **kwargs) -> Any:
+        max_ = kwargs.pop('max', 1)
+
+        # An explicitly empty updated (e.g. an edit that didn't change any
+        # props) with nothing else to send means there is nothing to patch.
+        if (updated is not None and not updated and not deleted
+                and not overridden and not any(kwargs.values())):
+            return updated, deleted, overridden
+
         async with self.patch_lock:
+            return await self._patch(updated, deleted, overridden,
+                                     max_=max_, **kwargs)
+
+    async def _patch(self, updated: Optional[dict] = None,
+                     deleted: Optional[list] = None,
+                     overridden: Optional[dict] = None, *,
+                     max_: int = 1,
+                     **kwargs) -> Any:
+        # patch_lock must be held by the caller.
+        try:
+            await self.meta.meta_ready_event.wait()
+
+            # If no updated is passed then just select the first
+            # value to "update" as fortnite returns an error if
+            # the update meta is empty.
+            _updated = updated or self.meta.get_schema(max=max_)
+            _deleted = deleted or []
+            _overridden = overridden or {}
+
+            for val in _deleted:
+                _updated.pop(val, None)
+
+            while True:
+                try:
+                    await self.do_patch(
+                        updated=_updated,
+                        deleted=_deleted,
+                        overridden=_overridden,
+                        **kwargs
+                    )
+                    self.revision += 1
+                    return updated, deleted, overridden
+                except HTTPException as exc:
+                    m = 'errors.com.epicgames.social.party.stale_revision'
+                    if exc.message_code == m:
+                        self.revision = int(exc.message_vars[1])
+                        continue
+
+                    raise
+        finally:
+            self._config_cache = {}
+
+    async def _maybe_patch(self, updated: Optional[dict] = None,
+                           **kwargs: Any) -> Any:
+        # Inside edit() the props are sent by edit itself.
+        if self.edit_lock.locked():
+            return
+
+        # Nothing to wait for or nothing to merge, patch right away.
+        if ((self._pending_patch is None and not self.patch_lock.locked())
+                or not (updated or any(kwargs.values()))):
+            return await self.patch(updated=updated, **kwargs)
+
+        # Setters called while another patch is being sent, e.g. through
+        # asyncio.gather(), are merged into a single patch which is sent as
+        # soon as the current one is done.
+        if self._pending_patch is None:
+            self._pending_patch = ({'updated': {}}, [])
+            self.client.loop.create_task(self._send_pending_patch())
+
+        pending, waiters = self._pending_patch
+        kwargs['updated'] = updated
+        for key, value in kwargs.items():
+            if not value:
+                continue
+
+            current = pending.get(key)
+            if current is None:
+                pending[key] = value.copy()
+            elif isinstance(current, list):
+                current.extend(value)
+            else:
+                current.update(value)
+
+        waiter = self.client.loop.create_future()
+        waiters.append(waiter)
+        return await waiter
+
+    async def _send_pending_patch(self) -> None:
+        async with self.patch_lock:
+            kwargs, waiters = self._pending_patch
+            self._pending_patch = None
+
             try:
-                await self.meta.meta_ready_event.wait()
-                while True:
-                    try:
-                        # If no updated is passed then just select the first
-                        # value to "update" as fortnite returns an error if
-                        # the update meta is empty.
-                        max_ = kwargs.pop('max', 1)
-                        _updated = updated or self.meta.get_schema(max=max_)
-                        _deleted = deleted or []
-                        _overridden = overridden or {}
-
-                        for val in _deleted:
-                            try:
-                                del _updated[val]
-                            except KeyError:
-                                pass
-
-                        await self.do_patch(
-                            updated=_updated,
-                            deleted=_deleted,
-                            overridden=_overridden,
-                            **kwargs
-                        )
-                        self.revision += 1
-                        return updated, deleted, overridden
-                    except HTTPException as exc:
-                        m = 'errors.com.epicgames.social.party.stale_revision'
-                        if exc.message_code == m:
-                            self.revision = int(exc.message_vars[1])
-                            continue
-
-                        raise
-            finally:
-                self._config_cache = {}
+                result = await self._patch(**kwargs)
+            except asyncio.CancelledError:
+                for waiter in waiters:
+                    waiter.cancel()
+                raise
+            except Exception as exc:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(exc)
+            else:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(result)
 
     async def _edit(self,
                     *coros: List[Union[Awaitable, functools.partial]]) -> None:
         to_gather = {}
         for coro in reversed(coros):
             if isinstance(coro, functools.partial):
-                result = getattr(coro.func, '__self__', None)
-                if result is None:
-                    coro = coro.func(self, *coro.args, **coro.keywords)
+                func = coro.func
+                if getattr(func, '__self__', None) is None:
+                    coro = func(self, *coro.args, **coro.keywords)
                 else:
                     coro = coro()
 
-            if coro.__qualname__ in to_gather:
+            name = coro.__qualname__
+            if name in to_gather:
                 coro.close()
             else:
-                to_gather[coro.__qualname__] = coro
-
-        before = self.meta.schema.copy()
+                to_gather[name] = coro
+
+        # The meta logs the previous value of every prop the coroutines
+        # write so only those props have to be compared afterwards.
+        edit_log = {}
+        edit_logs = self.meta._edit_logs
+        edit_logs.append(edit_log)
+
+        # A free lock is taken directly, which doesn't suspend. MaybeLock
+        # is only needed to avoid waiting on an edit that is already running.
+        if self.edit_lock.locked():
+            lock = MaybeLock(self.edit_lock)
+        else:
+            lock = self.edit_lock
 
-        async with MaybeLock(self.edit_lock):
-            await asyncio.gather(*list(to_gather.values()))
+        try:
+            async with lock:
+                await asyncio.gather(*to_gather.values())
+        finally:
+            edit_logs.remove(edit_log)
 
+        schema = self.meta.schema
         updated = {}
         deleted = []
-        for prop, value in before.items():
-            try:
-                new_value = self.meta.schema[prop]
-            except KeyError:
-                deleted.append(prop)
-                continue
-
-            if value != new_value:
+        for prop, value in edit_log.items():
+            new_value = schema.get(prop)
+            if new_value is None:
+                if value is not None:
+                    deleted.append(prop)
+            elif value != new_value:
                 updated[prop] = new_value
 
         return updated, deleted, self._config_cache
@@ -503,45 +769,82 @@ class Patchable:
 
 
 class MetaBase:
+    __slots__ = ('schema', '_decoded', '_edit_logs')
+
     def __init__(self) -> None:
         self.schema = {}
 
+        # Decoded values of json props. Entries are dropped whenever the
+        # raw value of the prop changes.
+        self._decoded = {}
+
+        # One dict per running Patchable._edit() mapping the props written
+        # by setters to their value before the first write.
+        self._edit_logs = []
+
+    def _log_write(self, prop: str) -> None:
+        for edit_log in self._edit_logs:
+            if prop not in edit_log:
+                edit_log[prop] = self.schema.get(prop)
+
     def set_prop(self, prop: str, value: Any, *,
                  raw: bool = False) -> Any:
+        self._decoded.pop(prop, None)
+
+        # Raw values come from the server and are never logged.
         if raw:
             self.schema[prop] = str(value)
             return self.schema[prop]
 
-        _t = prop[-1:]
-        if _t == 'j':
-            self.schema[prop] = json.dumps(value)
-        elif _t == 'U':
-            self.schema[prop] = int(value)
-        else:
-            self.schema[prop] = str(value)
+        self._log_write(prop)
+        self.schema[prop] = _ENCODERS.get(prop[-1:], str)(value)
         return self.schema[prop]
 
+    def patch_prop(self, prop: str, value: dict, *,
+                   owned: bool = False) -> Dict[str, str]:
+        # Sets a json prop and returns it as an updated meta dict. value is
+        # normally not cached as the decoded form since it may be owned by
+        # the caller or be a shared default, the prop is decoded again when
+        # read. Setters that built value themselves out of the cached value
+        # and plain scalars pass owned=True to keep it as the decoded form.
+        encoded = self.set_prop(prop, value)
+        if owned:
+            self._decoded[prop] = value
+
+        return {prop: encoded}
+
+    def _get_json(self, prop: str) -> Any:
+        # Returns the cached decoded value of a json prop. The value is shared
+        # so it must never be modified or handed out, use get_prop() for that.
+        try:
+            return self._decoded[prop]
+        except KeyError:
+            pass
+
+        _v = self.schema.get(prop)
+        if _v is None:
+            return {}
+
+        decoded = self._decoded[prop] = json_loads(_v)
+        return decoded
+
     def get_prop(self, prop: str, *, raw: bool = False) -> Any:
+        # Json props are returned as a copy that the caller is free to
+        # modify. Internal read only and copy-on-write paths use _get_json()
+        # to skip the copy.
         if raw:
             return self.schema.get(prop)
 
         _t = prop[-1:]
-        _v = self.schema.get(prop)
-        if _t == 'b':
-            return not (_v is None or (isinstance(_v, str)
-                        and _v.lower() == 'false'))
-        elif _t == 'j':
-            return {} if _v is None else json.loads(_v)
-        elif _t == 'U':
-            return 0 if _v is None else int(_v)
-        else:
-            return '' if _v is None else str(_v)
+        if _t == 'j':
+            return _copy_json(self._get_json(prop))
+
+        return _DECODERS.get(_t, _decode_str)(self.schema.get(prop))
 
     def delete_prop(self, prop: str) -> str:
-        try:
-            del self.schema[prop]
-        except KeyError:
-            pass
+        self._log_write(prop)
+        self._decoded.pop(prop, None)
+        self.schema.pop(prop, None)
 
         return prop
 
@@ -555,16 +858,150 @@ class MetaBase:
 
     def remove(self, schema: Iterable[str]) -> None:
         for prop in schema:
-            try:
-                del self.schema[prop]
-            except KeyError:
-                pass
+            self._decoded.pop(prop, None)
+            self.schema.pop(prop, None)
 
     def get_schema(self, max: Optional[int] = None) -> dict:
         return dict(list(self.schema.items())[:max])
 
 
+# Placeholders for the character dependent parts of the default member meta.
+# They are substituted with the randomly chosen default character whenever a
+# new PartyMemberMeta is created.
+_CHARACTER_PLACEHOLDER = '__CID__'
+_HERO_PLACEHOLDER = '__HID__'
+
+# Asset type prefixes of the instrument slots in MpLoadout.
+_INSTRUMENT_PREFIXES = {
+    'sb': 'SparksBass:',
+    'sg': 'SparksGuitar:',
+    'sd': 'SparksDrums:',
+    'sk': 'SparksKeyboard:',
+    'sm': 'SparksMicrophone:',
+}
+
+# Names of the cosmeticStats entries in AthenaCosmeticLoadout.
+_RANK_STAT = 'HabaneroProgression'
+_VICTORY_CROWNS_STAT = 'TotalRoyalRoyales'
+_HAS_CROWN_STAT = 'HasCrown'
+
+_MEMBER_META_DEFAULTS = types.MappingProxyType({
+    "Default:CurrentIsland_j": (
+        '{"CurrentIsland":{"linkId":{"mnemonic":"","version":-1},"worldId":'
+        '{"iD":"","ownerId":"INVALID","name":""},"sessionId":"","joinInfo":'
+        '{"islandJoinability":"CanNotBeJoinedOrWatched","bIsWorldJoinable":'
+        'false,"sessionKey":""}}}'
+    ),
+    "Default:SuggestedIsland_j": (
+        '{"SuggestedIsland":{"linkId":{"mnemonic":"","version":-1},"session":'
+        '{"iD":"","joinInfo":{"joinability":"CanNotBeJoinedOrWatched",'
+        '"sessionKey":""}},"world":{"iD":"","ownerId":"INVALID","name":"",'
+        '"bIsJoinable":false},"productModes":[],"privacy":"Undefined",'
+        '"regionId":"EU"}}'
+    ),
+    "Default:ArbitraryCustomDataStore_j": '{"ArbitraryCustomDataStore":[]}',
+    "Default:AthenaBannerInfo_j": (
+        '{"AthenaBannerInfo":{"bannerIconId":"standardbanner15",'
+        '"bannerColorId":"defaultcolor15","seasonLevel":1}}'
+    ),
+    "Default:AthenaCosmeticLoadoutVariants_j": (
+        '{"AthenaCosmeticLoadoutVariants":{"vL":{},"fT":false}}'
+    ),
+    "Default:AthenaCosmeticLoadout_j": (
+        '{"AthenaCosmeticLoadout":{"characterPrimaryAssetId":'
+        '"AthenaCharacter:__CID__","characterEKey":"","backpackDef":"None",'
+        '"backpackEKey":"","pickaxeDef":'
+        '"/Game/Athena/Items/Cosmetics/Pickaxes/DefaultPickaxe'
+        '.DefaultPickaxe","pickaxeEKey":"","contrailDef":'
+        '"/Game/Athena/Items/Cosmetics/Contrails/DefaultContrail'
+        '.DefaultContrail","contrailEKey":"","shoesDef":"None","shoesEKey":"",'
+        '"scratchpad":[],"cosmeticStats":[{"statName":"HabaneroProgression",'
+        '"statValue":0},{"statName":"TotalVictoryCrowns","statValue":0},'
+        '{"statName":"TotalRoyalRoyales","statValue":0},{"statName":'
+        '"HasCrown","statValue":0}]}}'
+    ),
+    "Default:BattlePassInfo_j": (
+        '{"BattlePassInfo":{"bHasPurchasedPass":false,"passLevel":1}}'
+    ),
+    "Default:bIsPartyUsingPartySignal_b": "false",
+    "Default:CampaignHero_j": (
+        '{"CampaignHero":{"heroItemInstanceId":"","heroType":'
+        '"FortHeroType\'/Game/Athena/Heroes/__HID__.__HID__\'"}}'
+    ),
+    "Default:CampaignInfo_j": (
+        '{"CampaignInfo":{"matchmakingLevel":0,"zoneInstanceId":"",'
+        '"homeBaseVersion":1}}'
+    ),
+    "Default:CrossplayPreference_s": "OptedIn",
+    "Default:DownloadOnDemandProgress_d": "0.000000",
+    "Default:FeatDefinition_s": "None",
+    "Default:FortCommonMatchmakingData_j": (
+        '{"FortCommonMatchmakingData":{"req":{"linkId":{"mnemonic":"",'
+        '"version":-1},"modes":[],"matchmakingTransaction":"NotReady","rqstr":'
+        '"INVALID","v":0},"v":0,"res":"N"}}'
+    ),
+    "Default:FortMatchmakingMemberData_j": (
+        '{"FortMatchmakingMemberData":{"req":{"mbrs":[{"iD":"0","r":"N","g":'
+        '{"iD":{"mnemonic":"","version":-1},"t":"X","ses":'
+        '"FRONTEND-DCC755264A748BD1683D08AB8BDA3556"},"v":101}],"rqstr":"0",'
+        '"v":1},"v":1,"res":"N"}}'
+    ),
+    "Default:FrontEndMapMarker_j": (
+        '{"FrontEndMapMarker":{"markerLocation":{"x":0,"y":0},"bIsSet":false}}'
+    ),
+    "Default:FrontendEmote_j": (
+        '{"FrontendEmote":{"emoteItemDef":"None","emoteEKey":"",'
+        '"emoteSection":-1}}'
+    ),
+    "Default:JoinInProgressData_j": (
+        '{"JoinInProgressData":{"request":{"target":"INVALID","time":0},'
+        '"responses":[]}}'
+    ),
+    "Default:JoinMethod_s": "Creation",
+    "Default:LobbyState_j": (
+        '{"LobbyState":{"inGameReadyCheckStatus":"None","gameReadiness":'
+        '"NotReady","readyInputType":"Count","currentInputType":'
+        '"MouseAndKeyboard","hiddenMatchmakingDelayMax":0,'
+        '"hasPreloadedAthena":false}}'
+    ),
+    "Default:MemberSquadAssignmentRequest_j": (
+        '{"MemberSquadAssignmentRequest":{"startingAbsoluteIdx":-1,'
+        '"targetAbsoluteIdx":-1,"swapTargetMemberId":"INVALID","version":0}}'
+    ),
+    "Default:NumAthenaPlayersLeft_U": 0,
+    "Default:PackedState_j": (
+        '{"PackedState":{"subGame":"Athena","location":"PreLobby","gameMode":'
+        '"None","voiceChatStatus":"PartyVoice","hasCompletedSTWTutorial":'
+        'false,"hasPurchasedSTW":false,"platformSupportsSTW":true,'
+        '"bReturnToLobbyAndReadyUp":false,"bHideReadyUp":false,'
+        '"bDownloadOnDemandActive":false,"bIsPartyLFG":false,'
+        '"bShouldRecordPartyChannel":false}}'
+    ),
+    "Default:PlatformData_j": (
+        '{"PlatformData":{"platform":{"platformDescription":{"name":"WIN",'
+        '"platformType":"DESKTOP","onlineSubsystem":"None","sessionType":"",'
+        '"externalAccountType":"","crossplayPool":"DESKTOP"}},"uniqueId":'
+        '"INVALID","sessionId":""}}'
+    ),
+    "Default:SharedQuests_j": '{"SharedQuests":{"bcktMap":{},"pndQst":""}}',
+    "Default:SpectateInfo_j": (
+        '{"SpectateInfo":{"gameSessionId":"","gameSessionKey":""}}'
+    ),
+    "Default:UtcTimeStartedMatchAthena_s": "0001-01-01T00:00:00.000Z",
+    "Default:MpLoadout_j": (
+        '{"MpLoadout":{"d":{"sb":{"i":"SparksBass:Sparks_Bass_Generic","v":'
+        '{"0":"0"}},"sg":{"i":"SparksGuitar:Sparks_Guitar_Generic","v":{"0":'
+        '"0"}},"sd":{"i":"SparksDrums:Sparks_Drum_Generic","v":{"0":"0"}},'
+        '"sk":{"i":"SparksKeyboard:Sparks_Keytar_Generic","v":{"0":"0"}},"sm":'
+        '{"i":"SparksMicrophone:Sparks_Mic_Generic","v":{"0":"0"}}}}}'
+    ),
+})
+
+
 class PartyMemberMeta(MetaBase):
+    __slots__ = ('member', 'meta_ready_event', 'has_been_updated',
+                 'def_character')
+
     def __init__(self, member: 'PartyMemberBase',
                  meta: Optional[dict] = None) -> None:
         super().__init__()
@@ -575,291 +1012,19 @@ class PartyMemberMeta(MetaBase):
 
         self.def_character = DefaultCharactersChapter3.get_random_name()
 
-        self.schema = {
-            "Default:CurrentIsland_j": json.dumps({
-                "CurrentIsland": {
-                    "linkId": {
-                        "mnemonic": "",
-                        "version": -1
-                    },
-                    "worldId": {
-                        "iD": "",
-                        "ownerId": "INVALID",
-                        "name": ""
-                    },
-                    "sessionId": "",
-                    "joinInfo": {
-                        "islandJoinability": "CanNotBeJoinedOrWatched",
-                        "bIsWorldJoinable": False,
-                        "sessionKey": ""
-                    }
-                }
-            }),
-            "Default:SuggestedIsland_j": json.dumps({
-                "SuggestedIsland": {
-                    "linkId": {
-                        "mnemonic": "",
-                        "version": -1
-                    },
-                    "session": {
-                        "iD": "",
-                        "joinInfo": {
-                            "joinability": "CanNotBeJoinedOrWatched",
-                            "sessionKey": ""
-                        }
-                    },
-                    "world": {
-                        "iD": "",
-                        "ownerId": "INVALID",
-                        "name": "",
-                        "bIsJoinable": False
-                    },
-                    "productModes": [],
-                    "privacy": "Undefined",
-                    "regionId": "EU"
-                }
-            }),
-            "Default:ArbitraryCustomDataStore_j": json.dumps({
-                "ArbitraryCustomDataStore": []
-            }),
-            "Default:AthenaBannerInfo_j": json.dumps({
-                "AthenaBannerInfo": {
-                    "bannerIconId": "standardbanner15",
-                    "bannerColorId": "defaultcolor15",
-                    "seasonLevel": 1
-                }
-            }),
-            "Default:AthenaCosmeticLoadoutVariants_j": json.dumps({
-                "AthenaCosmeticLoadoutVariants": {
-                    "vL": {},
-                    "fT": False
-                }
-            }),
-            "Default:AthenaCosmeticLoadout_j": json.dumps({
-                "AthenaCosmeticLoadout": {
-                    "characterPrimaryAssetId": f"AthenaCharacter:{self.def_character}",
-                    "characterEKey": "",
-                    "backpackDef": "None",
-                    "backpackEKey": "",
-                    "pickaxeDef": "/Game/Athena/Items/Cosmetics/Pickaxes/DefaultPickaxe.DefaultPickaxe",
-                    "pickaxeEKey": "",
-                    "contrailDef": "/Game/Athena/Items/Cosmetics/Contrails/DefaultContrail.DefaultContrail",
-                    "contrailEKey": "",
-                    "shoesDef": "None",
-                    "shoesEKey": "",
-                    "scratchpad": [],
-                    "cosmeticStats": [
-                        {
-                            "statName": "HabaneroProgression",
-                            "statValue": 0
-                        },
-                        {
-                            "statName": "TotalVictoryCrowns",
-                            "statValue": 0
-                        },
-                        {
-                            "statName": "TotalRoyalRoyales",
-                            "statValue": 0
-                        },
-                        {
-                            "statName": "HasCrown",
-                            "statValue": 0
-                        }
-                    ]
-                }
-            }),
-            "Default:BattlePassInfo_j": json.dumps({
-                "BattlePassInfo": {
-                    "bHasPurchasedPass": False,
-                    "passLevel": 1
-                }
-            }),
-            "Default:bIsPartyUsingPartySignal_b": "false",
-            "Default:CampaignHero_j": json.dumps({
-                "CampaignHero": {
-                    "heroItemInstanceId": "",
-                    "heroType": ("FortHeroType'/Game/Athena/Heroes/{0}.{0}'"
-                                 "".format(self.def_character.replace("CID","HID")))
-                }
-            }),
-            "Default:CampaignInfo_j": json.dumps({
-                "CampaignInfo": {
-                    "matchmakingLevel": 0,
-                    "zoneInstanceId": "",
-                    "homeBaseVersion": 1
-                }
-            }),
-            "Default:CrossplayPreference_s": "OptedIn",
-            "Default:DownloadOnDemandProgress_d": "0.000000",
-            "Default:FeatDefinition_s": "None",
-            "Default:FortCommonMatchmakingData_j": json.dumps({
-                "FortCommonMatchmakingData": {
-                    "req": {
-                        "linkId": {
-                            "mnemonic": "",
-                            "version": -1
-                        },
-                        "modes": [],
-                        "matchmakingTransaction": "NotReady",
-                        "rqstr": "INVALID",
-                        "v": 0
-                    },
-                    "v": 0,
-                    "res": "N"
-                }
-            }),
-            "Default:FortMatchmakingMemberData_j": json.dumps({
-                "FortMatchmakingMemberData": {
-                    "req": {
-                        "mbrs": [
-                            {
-                                "iD": "0",
-                                "r": "N",
-                                "g": {
-                                    "iD": {
-                                        "mnemonic": "",
-                                        "version": -1
-                                    },
-                                    "t": "X",
-                                    "ses": "FRONTEND-DCC755264A748BD1683D08AB8BDA3556"
-                                },
-                                "v": 101
-                            }
-                        ],
-                        "rqstr": "0",
-                        "v": 1
-                    },
-                    "v": 1,
-                    "res": "N"
-                }
-            }),
-            "Default:FrontEndMapMarker_j": json.dumps({
-                "FrontEndMapMarker": {
-                    "markerLocation": {
-                        "x": 0,
-                        "y": 0
-                    },
-                    "bIsSet": False
-                }
-            }),
-            "Default:FrontendEmote_j": json.dumps({
-                "FrontendEmote": {
-                    "emoteItemDef": "None",
-                    "emoteEKey": "",
-                    "emoteSection": -1
-                }
-            }),
-            "Default:JoinInProgressData_j": json.dumps({
-                "JoinInProgressData": {
-                    "request": {
-                        "target": "INVALID",
-                        "time": 0
-                    },
-                    "responses": []
-                }
-            }),
-            "Default:JoinMethod_s": "Creation",
-            "Default:LobbyState_j": json.dumps({
-                "LobbyState": {
-                    "inGameReadyCheckStatus": "None",
-                    "gameReadiness": "NotReady",
-                    "readyInputType": "Count",
-                    "currentInputType": "MouseAndKeyboard",
-                    "hiddenMatchmakingDelayMax": 0,
-                    "hasPreloadedAthena": False
-                }
-            }),
-            "Default:MemberSquadAssignmentRequest_j": json.dumps({
-                "MemberSquadAssignmentRequest": {
-                    "startingAbsoluteIdx": -1,
-                    "targetAbsoluteIdx": -1,
-                    "swapTargetMemberId": "INVALID",
-                    "version": 0
-                }
-            }),
-            "Default:NumAthenaPlayersLeft_U": 0,
-            "Default:PackedState_j": json.dumps({
-                "PackedState": {
-                    "subGame": "Athena",
-                    "location": "PreLobby",
-                    "gameMode": "None",
-                    "voiceChatStatus": "PartyVoice",
-                    "hasCompletedSTWTutorial": False,
-                    "hasPurchasedSTW": False,
-                    "platformSupportsSTW": True,
-                    "bReturnToLobbyAndReadyUp": False,
-                    "bHideReadyUp": False,
-                    "bDownloadOnDemandActive": False,
-                    "bIsPartyLFG": False,
-                    "bShouldRecordPartyChannel": False
-                }
-            }),
-            "Default:PlatformData_j": json.dumps({
-                "PlatformData": {
-                    "platform": {
-                        "platformDescription": {
-                            "name": "WIN",
-                            "platformType": "DESKTOP",
-                            "onlineSubsystem": "None",
-                            "sessionType": "",
-                            "externalAccountType": "",
-                            "crossplayPool": "DESKTOP"
-                        }
-                    },
-                    "uniqueId": "INVALID",
-                    "sessionId": ""
-                }
-            }),
-            "Default:SharedQuests_j": json.dumps({
-                "SharedQuests": {
-                    "bcktMap": {},
-                    "pndQst": ""
-                }
-            }),
-            "Default:SpectateInfo_j": json.dumps({
-                "SpectateInfo": {
-                    "gameSessionId": "",
-                    "gameSessionKey": ""
-                }
-            }),
-            "Default:UtcTimeStartedMatchAthena_s": "0001-01-01T00:00:00.000Z",
-            "Default:MpLoadout_j": json.dumps({
-                "MpLoadout": {
-                    "d": {
-                        "sb": {
-                            "i": "SparksBass:Sparks_Bass_Generic",
-                            "v": {
-                                "0": "0"
-                            }
-                        },
-                        "sg": {
-                            "i": "SparksGuitar:Sparks_Guitar_Generic",
-                            "v": {
-                                "0": "0"
-                            }
-                        },
-                        "sd": {
-                            "i": "SparksDrums:Sparks_Drum_Generic",
-                            "v": {
-                                "0": "0"
-                            }
-                        },
-                        "sk": {
-                            "i": "SparksKeyboard:Sparks_Keytar_Generic",
-                            "v": {
-                                "0": "0"
-                            }
-                        },
-                        "sm": {
-                            "i": "SparksMicrophone:Sparks_Mic_Generic",
-                            "v": {
-                                "0": "0"
-                            }
-                        }
-                    }
-                }
-            })
-        }
+        self.schema = dict(_MEMBER_META_DEFAULTS)
+
+        key = 'Default:AthenaCosmeticLoadout_j'
+        self.schema[key] = self.schema[key].replace(
+            _CHARACTER_PLACEHOLDER,
+            self.def_character,
+        )
+
+        key = 'Default:CampaignHero_j'
+        self.schema[key] = self.schema[key].replace(
+            _HERO_PLACEHOLDER,
+            self.def_character.replace('CID', 'HID'),
+        )
 
         if meta is not None:
             self.update(meta, raw=True)
@@ -874,99 +1039,111 @@ class PartyMemberMeta(MetaBase):
 
     @property
     def ready(self) -> bool:
-        base = self.get_prop('Default:LobbyState_j')
+        base = self._get_json('Default:LobbyState_j')
         return base['LobbyState'].get('gameReadiness', 'NotReady')
 
     @property
     def input(self) -> str:
-        base = self.get_prop('Default:LobbyState_j')
+        base = self._get_json('Default:LobbyState_j')
         return base['LobbyState'].get('currentInputType', 'None')
 
     @property
     def outfit(self) -> str:
-        base = self.get_prop('Default:AthenaCosmeticLoadout_j')
+        base = self._get_json('Default:AthenaCosmeticLoadout_j')
         return base['AthenaCosmeticLoadout'].get('characterPrimaryAssetId', 'None')
 
     @property
     def backpack(self) -> str:
-        base = self.get_prop('Default:AthenaCosmeticLoadout_j')
+        base = self._get_json('Default:AthenaCosmeticLoadout_j')
         return base['AthenaCosmeticLoadout'].get('backpackDef', 'None')
 
     @property
     def pickaxe(self) -> str:
-        base = self.get_prop('Default:AthenaCosmeticLoadout_j')
+        base = self._get_json('Default:AthenaCosmeticLoadout_j')
         return base['AthenaCosmeticLoadout'].get('pickaxeDef', 'None')
 
     @property
     def contrail(self) -> str:
-        base = self.get_prop('Default:AthenaCosmeticLoadout_j')
+        base = self._get_json('Default:AthenaCosmeticLoadout_j')
         return base['AthenaCosmeticLoadout'].get('contrailDef', 'None')
 
     @property
     def kicks(self) -> str:
-        base = self.get_prop('Default:AthenaCosmeticLoadout_j')
+        base = self._get_json('Default:AthenaCosmeticLoadout_j')
         return base['AthenaCosmeticLoadout'].get('shoesDef', 'None')
 
+    def _get_variants(self) -> Dict[str, Any]:
+        base = self._get_json('Default:AthenaCosmeticLoadoutVariants_j')
+        return base['AthenaCosmeticLoadoutVariants'].get('vL', {})
+
+    def _get_slot_variants(self, slot: str) -> List[Dict[str, str]]:
+        return _copy_json(self._get_variants().get(slot, {}).get('i', []))
+
+    def _get_scratchpad(self) -> list:
+        base = self._get_json('Default:AthenaCosmeticLoadout_j')
+        return base['AthenaCosmeticLoadout'].get('scratchpad', [])
+
+    def _get_custom_data_store(self) -> list:
+        base = self._get_json('Default:ArbitraryCustomDataStore_j')
+        return base['ArbitraryCustomDataStore']
+
     @property
     def variants(self) -> List[Dict[str, str]]:
-        base = self.get_prop('Default:AthenaCosmeticLoadoutVariants_j')
-        return base['AthenaCosmeticLoadoutVariants'].get('vL', {})
+        return _copy_json(self._get_variants())
 
     @property
     def outfit_variants(self) -> List[Dict[str, str]]:
-        return self.variants.get('athenaCharacter', {}).get('i', [])
+        return self._get_slot_variants('athenaCharacter')
 
     @property
     def backpack_variants(self) -> List[Dict[str, str]]:
-        return self.variants.get('athenaBackpack', {}).get('i', [])
+        return self._get_slot_variants('athenaBackpack')
 
     @property
     def pickaxe_variants(self) -> List[Dict[str, str]]:
-        return self.variants.get('athenaPickaxe', {}).get('i', [])
+        return self._get_slot_variants('athenaPickaxe')
 
     @property
     def contrail_variants(self) -> List[Dict[str, str]]:
-        return self.variants.get('athenaContrail', {}).get('i', [])
+        return self._get_slot_variants('athenaContrail')
 
     @property
     def scratchpad(self) -> list:
-        base = self.get_prop('Default:AthenaCosmeticLoadout_j')
-        return base['AthenaCosmeticLoadout'].get('scratchpad', [])
+        return _copy_json(self._get_scratchpad())
+
+    def _get_cosmetic_stat(self, name: str) -> Any:
+        base = self._get_json('Default:AthenaCosmeticLoadout_j')
+        stats = base['AthenaCosmeticLoadout'].get('cosmeticStats', ())
+        for stat in stats:
+            if stat.get('statName') == name:
+                return stat['statValue']
+
+        return 0
 
     @property
     def has_crown(self) -> list:
-        base = self.get_prop('Default:AthenaCosmeticLoadout_j')
-        return base['AthenaCosmeticLoadout'].get(
-            'cosmeticStats', [{}, {}, {}, {"statName": "HasCrown", "statValue": 0}]
-        )[3]['statValue']
+        return self._get_cosmetic_stat(_HAS_CROWN_STAT)
 
     @property
     def victory_crowns(self) -> list:
-        base = self.get_prop('Default:AthenaCosmeticLoadout_j')
-        return base['AthenaCosmeticLoadout'].get(
-            'cosmeticStats', [{}, {}, {"statName": "TotalRoyalRoyales", "statValue": 0}, {}]
-        )[2]['statValue']
+        return self._get_cosmetic_stat(_VICTORY_CROWNS_STAT)
 
     @property
     def rank(self) -> list:
-        base = self.get_prop('Default:AthenaCosmeticLoadout_j')
-        return base['AthenaCosmeticLoadout'].get(
-            'cosmeticStats', [{"statName": "HabaneroProgression", "statValue": 0}, {}, {}, {}]
-        )[0]['statValue']
+        return self._get_cosmetic_stat(_RANK_STAT)
 
     @property
     def custom_data_store(self) -> list:
-        base = self.get_prop('Default:ArbitraryCustomDataStore_j')
-        return base['ArbitraryCustomDataStore']
+        return _copy_json(self._get_custom_data_store())
 
     @property
     def emote(self) -> str:
-        base = self.get_prop('Default:FrontendEmote_j')
+        base = self._get_json('Default:FrontendEmote_j')
         return base['FrontendEmote'].get('emoteItemDef', 'None')
 
     @property
     def banner(self) -> Tuple[str, str, int]:
-        base = self.get_prop('Default:AthenaBannerInfo_j')
+        base = self._get_json('Default:AthenaBannerInfo_j')
         banner_info = base['AthenaBannerInfo']
 
         return (banner_info.get('bannerIconId'),
@@ -975,7 +1152,7 @@ class PartyMemberMeta(MetaBase):
 
     @property
     def battlepass_info(self) -> Tuple[bool, int]:
-        base = self.get_prop('Default:BattlePassInfo_j')
+        base = self._get_json('Default:BattlePassInfo_j')
         bp_info = base['BattlePassInfo']
 
         return (bp_info['bHasPurchasedPass'],
@@ -983,22 +1160,22 @@ class PartyMemberMeta(MetaBase):
 
     @property
     def platform(self) -> str:
-        base = self.get_prop('Default:PlatformData_j')
+        base = self._get_json('Default:PlatformData_j')
         return base['PlatformData']['platform']['platformDescription']['name']
 
     @property
     def location(self) -> str:
-        base = self.get_prop('Default:PackedState_j')
+        base = self._get_json('Default:PackedState_j')
         return base['PackedState']['location']
 
     @property
     def has_preloaded(self) -> bool:
-        base = self.get_prop('Default:LobbyState_j')
+        base = self._get_json('Default:LobbyState_j')
         return base['LobbyState']['hasPreloadedAthena']
 
     @property
     def spectate_party_member_available(self) -> bool:
-        base = self.get_prop('Default:SpectateInfo_j')
+        base = self._get_json('Default:SpectateInfo_j')
         return bool(base['SpectateInfo']['gameSessionKey'])
 
     @property
@@ -1014,14 +1191,28 @@ class PartyMemberMeta(MetaBase):
         prop = self.get_prop('Default:MemberSquadAssignmentRequest_j')
         return prop['MemberSquadAssignmentRequest']
 
+    def _get_instruments(self) -> Dict[str, Dict[str, Any]]:
+        data = self._get_json('Default:MpLoadout_j')['MpLoadout']['d']
+
+        # The loadout may have been sent json encoded, e.g. by older
+        # versions of this library.
+        if isinstance(data, str):
+            data = json_loads(data)
+
+        return data
+
+    @property
+    def instruments(self) -> Dict[str, Dict[str, Any]]:
+        return _copy_json(self._get_instruments())
+
     @property
     def frontend_marker_set(self) -> bool:
-        prop = self.get_prop('Default:FrontEndMapMarker_j')
+        prop = self._get_json('Default:FrontEndMapMarker_j')
         return prop['FrontEndMapMarker'].get('bIsSet', False)
 
     @property
     def frontend_marker_location(self) -> Tuple[float, float]:
-        prop = self.get_prop('Default:FrontEndMapMarker_j')
+        prop = self._get_json('Default:FrontEndMapMarker_j')
         location = prop['FrontEndMapMarker'].get('markerLocation')
         if location is None:
             return (0.0, 0.0)
@@ -1033,26 +1224,37 @@ class PartyMemberMeta(MetaBase):
     def maybesub(self, def_: Any) -> Any:
         return def_ if def_ else 'None'
 
+    def _set_fields(self, prop: str, top: str,
+                    fields: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+        data = dict(self._get_json(prop)[top])
+        for key, value in fields:
+            if value is not None:
+                data[key] = value
+
+        return self.patch_prop(prop, {top: data})
+
     def set_frontend_marker(self, *,
                             x: Optional[float] = None,
                             y: Optional[float] = None,
                             is_set: Optional[bool] = None
                             ) -> Dict[str, Any]:
-        prop = self.get_prop('Default:FrontEndMapMarker_j')
-        data = prop['FrontEndMapMarker']
+        prop = self._get_json('Default:FrontEndMapMarker_j')
+        data = dict(prop['FrontEndMapMarker'])
 
         # Swap y and x because epic uses y for horizontal and x for vertical
         # which messes with my brain.
-        if x is not None:
-            data['markerLocation']['y'] = x
-        if y is not None:
-            data['markerLocation']['x'] = y
+        if x is not None or y is not None:
+            location = data['markerLocation'] = dict(data['markerLocation'])
+            if x is not None:
+                location['y'] = x
+            if y is not None:
+                location['x'] = y
         if is_set is not None:
             data['bIsSet'] = is_set
 
         final = {'FrontEndMapMarker': data}
         key = 'Default:FrontEndMapMarker_j'
-        return {key: self.set_prop(key, final)}
+        return self.patch_prop(key, final)
 
     def set_member_squad_assignment_request(self, current_pos: int,
                                             target_pos: int,
@@ -1067,7 +1269,7 @@ class PartyMemberMeta(MetaBase):
         }
         final = {'MemberSquadAssignmentRequest': data}
         key = 'Default:MemberSquadAssignmentRequest_j'
-        return {key: self.set_prop(key, final)}
+        return self.patch_prop(key, final)
 
     def set_lobby_state(self, *,
                         in_game_ready_check_status: Optional[Any] = None,
@@ -1077,70 +1279,45 @@ class PartyMemberMeta(MetaBase):
                         hidden_matchmaking_delay_max: Optional[int] = None,
                         has_pre_loaded_athena: Optional[bool] = None,
                         ) -> Dict[str, Any]:
-        data = (self.get_prop('Default:LobbyState_j'))['LobbyState']
-
-        if in_game_ready_check_status is not None:
-            data['inGameReadyCheckStatus'] = in_game_ready_check_status
-        if game_readiness is not None:
-            data['gameReadiness'] = game_readiness
-        if ready_input_type is not None:
-            data['readyInputType'] = ready_input_type
-        if current_input_type is not None:
-            data['currentInputType'] = current_input_type
-        if hidden_matchmaking_delay_max is not None:
-            data['hiddenMatchmakingDelayMax'] = hidden_matchmaking_delay_max
-        if has_pre_loaded_athena is not None:
-            data['hasPreloadedAthena'] = has_pre_loaded_athena
-
-        final = {'LobbyState': data}
-        key = 'Default:LobbyState_j'
-        return {key: self.set_prop(key, final)}
+        return self._set_fields('Default:LobbyState_j', 'LobbyState', (
+            ('inGameReadyCheckStatus', in_game_ready_check_status),
+            ('gameReadiness', game_readiness),
+            ('readyInputType', ready_input_type),
+            ('currentInputType', current_input_type),
+            ('hiddenMatchmakingDelayMax', hidden_matchmaking_delay_max),
+            ('hasPreloadedAthena', has_pre_loaded_athena),
+        ))
 
     def set_emote(self, emote: Optional[str] = None, *,
                   emote_ekey: Optional[str] = None,
                   section: Optional[int] = None) -> Dict[str, Any]:
-        data = (self.get_prop('Default:FrontendEmote_j'))['FrontendEmote']
-
         if emote is not None:
-            data['emoteItemDef'] = self.maybesub(emote)
-        if emote_ekey is not None:
-            data['emoteItemDefEncryptionKey'] = emote_ekey
-        if section is not None:
-            data['emoteSection'] = section
+            emote = self.maybesub(emote)
 
-        final = {'FrontendEmote': data}
-        key = 'Default:FrontendEmote_j'
-        return {key: self.set_prop(key, final)}
+        return self._set_fields('Default:FrontendEmote_j', 'FrontendEmote', (
+            ('emoteItemDef', emote),
+            ('emoteItemDefEncryptionKey', emote_ekey),
+            ('emoteSection', section),
+        ))
 
     def set_banner(self, banner_icon: Optional[str] = None, *,
                    banner_color: Optional[str] = None,
                    season_level: Optional[int] = None) -> Dict[str, Any]:
         key = 'Default:AthenaBannerInfo_j'
-        data = (self.get_prop(key))['AthenaBannerInfo']
-
-        if banner_icon is not None:
-            data['bannerIconId'] = banner_icon
-        if banner_color is not None:
-            data['bannerColorId'] = banner_color
-        if season_level is not None:
-            data['seasonLevel'] = season_level
-
-        final = {'AthenaBannerInfo': data}
-        return {key: self.set_prop(key, final)}
+        return self._set_fields(key, 'AthenaBannerInfo', (
+            ('bannerIconId', banner_icon),
+            ('bannerColorId', banner_color),
+            ('seasonLevel', season_level),
+        ))
 
     def set_battlepass_info(self, has_purchased: Optional[bool] = None,
                             level: Optional[int] = None
                             ) -> Dict[str, Any]:
-        data = (self.get_prop('Default:BattlePassInfo_j'))['BattlePassInfo']
-
-        if has_purchased is not None:
-            data['bHasPurchasedPass'] = has_purchased
-        if level is not None:
-            data['passLevel'] = level
-
-        final = {'BattlePassInfo': data}
         key = 'Default:BattlePassInfo_j'
-        return {key: self.set_prop(key, final)}
+        return self._set_fields(key, 'BattlePassInfo', (
+            ('bHasPurchasedPass', has_purchased),
+            ('passLevel', level),
+        ))
 
     def set_cosmetic_loadout(self, *,
                              character: Optional[str] = None,
@@ -1159,8 +1336,8 @@ class PartyMemberMeta(MetaBase):
                              rank: Optional[int] = None
                              ) -> Dict[str, Any]:
 
-        prop = self.get_prop('Default:AthenaCosmeticLoadout_j')
-        data = prop['AthenaCosmeticLoadout']
+        prop = self._get_json('Default:AthenaCosmeticLoadout_j')
+        data = dict(prop['AthenaCosmeticLoadout'])
 
         if character is not None:
             data['characterPrimaryAssetId'] = character
@@ -1184,16 +1361,29 @@ class PartyMemberMeta(MetaBase):
             data['shoesEKey'] = shoes_ekey
         if scratchpad is not None:
             data['scratchpad'] = scratchpad
-        if has_crown is not None:
-            data['cosmeticStats'][3]['statValue'] = has_crown
-        if victory_crowns is not None:
-            data['cosmeticStats'][2]['statValue'] = victory_crowns
-        if rank is not None:
-            data['cosmeticStats'][0]['statValue'] = rank
+
+        for name, value in ((_HAS_CROWN_STAT, has_crown),
+                            (_VICTORY_CROWNS_STAT, victory_crowns),
+                            (_RANK_STAT, rank)):
+            if value is None:
+                continue
+
+            # The stat dicts are shared with the cached value so the list is
+            # rebuilt with a new dict instead of editing the stat in place.
+            stats = list(data.get('cosmeticStats', ()))
+            new_stat = {'statName': name, 'statValue': value}
+            for i, stat in enumerate(stats):
+                if stat.get('statName') == name:
+                    stats[i] = new_stat
+                    break
+            else:
+                stats.append(new_stat)
+
+            data['cosmeticStats'] = stats
 
         final = {'AthenaCosmeticLoadout': data}
         key = 'Default:AthenaCosmeticLoadout_j'
-        return {key: self.set_prop(key, final)}
+        return self.patch_prop(key, final)
 
     def set_variants(self, variants: List[dict]) -> Dict[str, Any]:
         final = {
@@ -1202,32 +1392,48 @@ class PartyMemberMeta(MetaBase):
             }
         }
         key = 'Default:AthenaCosmeticLoadoutVariants_j'
-        return {key: self.set_prop(key, final)}
+        return self.patch_prop(key, final)
+
+    def set_slot_variants(self, slot: str,
+                          variants: Optional[List[dict]]) -> Dict[str, Any]:
+        # Nothing is returned when the slot already holds these variants
+        # so the setters don't resend an unchanged prop.
+        current = dict(self._get_variants())
+        new = {'i': variants} if variants is not None else None
+        if current.get(slot) == new:
+            return {}
+
+        if new is None:
+            del current[slot]
+        else:
+            current[slot] = new
+
+        return self.set_variants(variants=current)
 
     def set_custom_data_store(self, value: list) -> Dict[str, Any]:
         final = {
             'ArbitraryCustomDataStore': value
         }
         key = 'Default:ArbitraryCustomDataStore_j'
-        return {key: self.set_prop(key, final)}
+        return self.patch_prop(key, final)
 
     def set_match_state(self, location: str = None) -> Dict[str, Any]:
-        data = (self.get_prop('Default:PackedState_j'))
+        key = 'Default:PackedState_j'
+        data = dict(self._get_json(key))
 
         if location is not None:
-            data['PackedState']['location'] = location
+            data['PackedState'] = {**data['PackedState'], 'location': location}
 
-        key = 'Default:PackedState_j'
-        return {key: self.set_prop(key, data)}
+        return self.patch_prop(key, data)
 
     def set_requested_playlist(self, playlist_id: str) -> Dict[str, Any]:
         key = 'Default:SuggestedIsland_j'
-        data = (self.get_prop('Default:SuggestedIsland_j'))['SuggestedIsland']
+        data = dict(self._get_json(key)['SuggestedIsland'])
 
-        data['linkId']['mnemonic'] = playlist_id
+        data['linkId'] = {**data['linkId'], 'mnemonic': playlist_id}
 
         final = {'SuggestedIsland': data}
-        return {key: self.set_prop(key, final)}
+        return self.patch_prop(key, final)
 
     def set_instruments(self,
                         bass: Optional[str] = None,
@@ -1242,36 +1448,133 @@ class PartyMemberMeta(MetaBase):
                         microphone_variants: Optional[dict] = None
                         ) -> Dict[str, Any]:
 
-        prop = self.get_prop('Default:MpLoadout_j')
-        data = prop['MpLoadout']['d']
-
-        if bass is not None:
-            data['sb']['i'] = f'SparksBass:{bass}'
-        if bass_variants is not None:
-            data['sb']['v'] = bass_variants
-        if guitar is not None:
-            data['sg']['i'] = f'SparksGuitar:{guitar}'
-        if guitar_variants is not None:
-            data['sg']['v'] = guitar_variants
-        if drums is not None:
-            data['sd']['i'] = f'SparksDrums:{drums}'
-        if drums_variants is not None:
-            data['sd']['v'] = drums_variants
-        if keytar is not None:
-            data['sk']['i'] = f'SparksKeyboard:{keytar}'
-        if keytar_variants is not None:
-            data['sk']['v'] = keytar_variants
-        if microphone is not None:
-            data['sm']['i'] = f'SparksMicrophone:{microphone}'
-        if microphone_variants is not None:
-            data['sm']['v'] = microphone_variants
-
-        final = {'MpLoadout': {"d": json.dumps(data)}}
+        slots = (
+            ('sb', bass, bass_variants),
+            ('sg', guitar, guitar_variants),
+            ('sd', drums, drums_variants),
+            ('sk', keytar, keytar_variants),
+            ('sm', microphone, microphone_variants),
+        )
+
+        data = dict(self._get_instruments())
+        for slot, instrument, variants in slots:
+            if instrument is None and variants is None:
+                continue
+
+            entry = data[slot] = dict(data[slot])
+            if instrument is not None:
+                entry['i'] = _INSTRUMENT_PREFIXES[slot] + instrument
+            if variants is not None:
+                entry['v'] = variants
+
+        final = {'MpLoadout': {'d': data}}
         key = 'Default:MpLoadout_j'
-        return {key: self.set_prop(key, final)}
+        return self.patch_prop(key, final)
+
+
+_PARTY_META_DEFAULTS = types.MappingProxyType({
+    "Default:ActivityName_s": "Squad",
+    "Default:ActivityType_s": "BR",
+    "Default:AllowJoinInProgress_b": "false",
+    "Default:AthenaPrivateMatch_b": "false",
+    "Default:AthenaSquadFill_b": "true",
+    "Default:CampaignInfo_j": (
+        '{"CampaignInfo":{"lobbyConnectionStarted":false,"matchmakingResult":'
+        '"NotStarted","matchmakingState":"NotMatchmaking",'
+        '"sessionIsCriticalMission":false,"zoneTileIndex":-1,"theaterId":"",'
+        '"tileStates":{"tileStates":[],"numSetBits":0}}}'
+    ),
+    "Default:CreativeDiscoverySurfaceRevisions_j": (
+        '{"CreativeDiscoverySurfaceRevisions":[{"surfaceName":'
+        '"CreativeDiscoverySurface_Frontend","revision":1}]}'
+    ),
+    "Default:CreativePortalCountdownStartTime_s": "0001-01-01T00:00:00.000Z",
+    "Default:CurrentRegionId_s": "EU",
+    "Default:CustomMatchKey_s": "",
+    "Default:FortCommonMatchmakingData_j": (
+        '{"FortCommonMatchmakingData":{"current":{"linkId":{"mnemonic":"",'
+        '"version":-1},"modes":[],"matchmakingTransaction":"NotReady","rqstr":'
+        '"INVALID","v":0},"commit":"One","data":{"req":{"linkId":{"mnemonic":'
+        '"","version":-1},"modes":[],"matchmakingTransaction":"NotReady",'
+        '"rqstr":"INVALID","v":0},"v":0,"brdcst":"R"}}}'
+    ),
+    "Default:FortMatchmakingMemberData_j": (
+        '{"FortMatchmakingMemberData":{"current":{"mbrs":[],"rqstr":"INVALID",'
+        '"v":0},"commit":"One","data":{"req":{"mbrs":[],"rqstr":"INVALID","v":'
+        '0},"v":0,"brdcst":"R"}}}'
+    ),
+    "Default:GameSessionKey_s": "",
+    "Default:LFGTime_s": "0001-01-01T00:00:00.000Z",
+    "Default:MatchmakingInfoString_s": "",
+    "Default:PartyIsJoinedInProgress_b": "false",
+    "Default:PartyMatchmakingInfo_j": (
+        '{"PartyMatchmakingInfo":{"buildId":-1,"hotfixVersion":-1,"regionId":'
+        '"","playlistName":"None","playlistRevision":0,"tournamentId":"",'
+        '"eventWindowId":"","linkCode":""}}'
+    ),
+    "Default:PartyState_s": "BattleRoyaleView",
+    "Default:PlatformSessions_j": '{"PlatformSessions":[]}',
+    "Default:PlaylistData_j": (
+        '{"PlaylistData":{"playlistName":"Playlist_DefaultSquad",'
+        '"tournamentId":"","eventWindowId":"","linkId":{"mnemonic":'
+        '"playlist_defaultsquad","version":-1},"bGracefullyUpgraded":false,'
+        '"matchmakingRulePreset":"RespectParties"}}'
+    ),
+    "Default:PrimaryGameSessionId_s": "",
+    # Set when the PartyMeta is created, see PartyMeta.__init__().
+    "Default:PrivacySettings_j": "",
+    "Default:SquadInformation_j": (
+        '{"SquadInformation":{"rawSquadAssignments":[],"squadData":'
+        '[{"jamTempo":0,"jamKey":0,"jamMode":0}]}}'
+    ),
+    "Default:RegionId_s": "EU",
+    "Default:SelectedIsland_j": (
+        '{"SelectedIsland":{"linkId":{"mnemonic":"playlist_defaultsquad",'
+        '"version":-1},"session":{"iD":"","joinInfo":{"joinability":'
+        '"CanNotBeJoinedOrWatched","sessionKey":""}},"world":{"iD":"",'
+        '"ownerId":"INVALID","name":"","bIsJoinable":false},"productModes":[],'
+        '"privacy":"NoFill","regionId":""}}'
+    ),
+    "Default:TileStates_j": '{"TileStates":[]}',
+    "Default:ZoneInstanceId_s": "",
+    "urn:epic:cfg:accepting-members_b": "true",
+    "urn:epic:cfg:build-id_s": "1:3:",
+    "urn:epic:cfg:can-join_b": "true",
+    "urn:epic:cfg:chat-enabled_b": "true",
+    "urn:epic:cfg:invite-perm_s": "Anyone",
+    "urn:epic:cfg:join-request-action_s": "Manual",
+    "urn:epic:cfg:party-type-id_s": "default",
+    "urn:epic:cfg:presence-perm_s": "Anyone",
+    "VoiceChat:implementation_s": "EOSVoiceChat",
+    "Default:CreativeInGameReadyCheckStatus_s": "None",
+    # "Default:PreferredPrivacy_s": "NoFill"
+})
+
+
+# Shared between all parties, so it must never be mutated.
+_SQUAD_DATA_DEFAULT = ({"jamTempo": 0, "jamKey": 0, "jamMode": 0},)
+
+# Party types that accept members without an invite.
+_OPEN_PARTY_TYPES = frozenset(('Public', 'FriendsOnly'))
+
+# Maps the PrivacySettings sent in the party meta to the privacy they
+# represent. Settings that don't match any privacy exactly fall back to the
+# first privacy with the same party type.
+_PRIVACY_LOOKUP = {}
+_PRIVACY_BY_TYPE = {}
+for _privacy in PartyPrivacy:
+    _PRIVACY_LOOKUP[(
+        _privacy.value['partyType'],
+        _privacy.value['inviteRestriction'],
+        _privacy.value['onlyLeaderFriendsCanJoin'],
+    )] = _privacy
+    _PRIVACY_BY_TYPE.setdefault(_privacy.value['partyType'], _privacy)
+del _privacy
 
 
 class PartyMeta(MetaBase):
+    __slots__ = ('party', 'meta_ready_event')
+
     def __init__(self, party: 'PartyBase',
                  meta: Optional[dict] = None) -> None:
         super().__init__()
@@ -1286,175 +1589,10 @@ class PartyMeta(MetaBase):
             'bOnlyLeaderFriendsCanJoin': privacy['onlyLeaderFriendsCanJoin'],
         }
 
-        self.schema = {
-            "Default:ActivityName_s": "Squad",
-            "Default:ActivityType_s": "BR",
-            "Default:AllowJoinInProgress_b": "false",
-            "Default:AthenaPrivateMatch_b": "false",
-            "Default:AthenaSquadFill_b": "true",
-            "Default:CampaignInfo_j": json.dumps({
-                "CampaignInfo": {
-                    "lobbyConnectionStarted": False,
-                    "matchmakingResult": "NotStarted",
-                    "matchmakingState": "NotMatchmaking",
-                    "sessionIsCriticalMission": False,
-                    "zoneTileIndex": -1,
-                    "theaterId": "",
-                    "tileStates": {
-                        "tileStates": [],
-                        "numSetBits": 0
-                    }
-                }
-            }),
-            "Default:CreativeDiscoverySurfaceRevisions_j": json.dumps({
-                "CreativeDiscoverySurfaceRevisions": [
-                    {
-                        "surfaceName": "CreativeDiscoverySurface_Frontend",
-                        "revision": 1
-                    }
-                ]
-            }),
-            "Default:CreativePortalCountdownStartTime_s": "0001-01-01T00:00:00.000Z",
-            "Default:CurrentRegionId_s": "EU",
-            "Default:CustomMatchKey_s": "",
-            "Default:FortCommonMatchmakingData_j": json.dumps({
-                "FortCommonMatchmakingData": {
-                    "current": {
-                        "linkId": {
-                            "mnemonic": "",
-                            "version": -1
-                        },
-                        "modes": [],
-                        "matchmakingTransaction": "NotReady",
-                        "rqstr": "INVALID",
-                        "v": 0
-                    },
-                    "commit": "One",
-                    "data": {
-                        "req": {
-                            "linkId": {
-                                "mnemonic": "",
-                                "version": -1
-                            },
-                            "modes": [],
-                            "matchmakingTransaction": "NotReady",
-                            "rqstr": "INVALID",
-                            "v": 0
-                        },
-                        "v": 0,
-                        "brdcst": "R"
-                    }
-                }
-            }),
-            "Default:FortMatchmakingMemberData_j": json.dumps({
-                "FortMatchmakingMemberData": {
-                    "current": {
-                        "mbrs": [],
-                        "rqstr": "INVALID",
-                        "v": 0
-                    },
-                    "commit": "One",
-                    "data": {
-                        "req": {
-                            "mbrs": [],
-                            "rqstr": "INVALID",
-                            "v": 0
-                        },
-                        "v": 0,
-                        "brdcst": "R"
-                    }
-                }
-            }),
-            "Default:GameSessionKey_s": "",
-            "Default:LFGTime_s": "0001-01-01T00:00:00.000Z",
-            "Default:MatchmakingInfoString_s": "",
-            "Default:PartyIsJoinedInProgress_b": "false",
-            "Default:PartyMatchmakingInfo_j": json.dumps({
-                "PartyMatchmakingInfo": {
-                    "buildId": -1,
-                    "hotfixVersion": -1,
-                    "regionId": "",
-                    "playlistName": "None",
-                    "playlistRevision": 0,
-                    "tournamentId": "",
-                    "eventWindowId": "",
-                    "linkCode": ""
-                }
-            }),
-            "Default:PartyState_s": "BattleRoyaleView",
-            "Default:PlatformSessions_j": json.dumps({
-                "PlatformSessions": []
-            }),
-            "Default:PlaylistData_j": json.dumps({
-                "PlaylistData": {
-                    "playlistName": "Playlist_DefaultSquad",
-                    "tournamentId": "",
-                    "eventWindowId": "",
-                    "linkId": {
-                        "mnemonic": "playlist_defaultsquad",
-                        "version": -1
-                    },
-                    "bGracefullyUpgraded": False,
-                    "matchmakingRulePreset": "RespectParties"
-                }
-            }),
-            "Default:PrimaryGameSessionId_s": "",
-            "Default:PrivacySettings_j": json.dumps({
-                'PrivacySettings': privacy_settings,
-            }),
-            "Default:SquadInformation_j": json.dumps({
-                "SquadInformation": {
-                    "rawSquadAssignments": [],
-                    "squadData": [
-                        {
-                            "jamTempo": 0,
-                            "jamKey": 0,
-                            "jamMode": 0
-                        }
-                    ]
-                }
-            }),
-            "Default:RegionId_s": "EU",
-            "Default:SelectedIsland_j": json.dumps({
-                "SelectedIsland": {
-                    "linkId": {
-                        "mnemonic": "playlist_defaultsquad",
-                        "version": -1
-                    },
-                    "session": {
-                        "iD": "",
-                        "joinInfo": {
-                            "joinability": "CanNotBeJoinedOrWatched",
-                            "sessionKey": ""
-                        }
-                    },
-                    "world": {
-                        "iD": "",
-                        "ownerId": "INVALID",
-                        "name": "",
-                        "bIsJoinable": False
-                    },
-                    "productModes": [],
-                    "privacy": "NoFill",
-                    "regionId": ""
-                }
-            }),
-            "Default:TileStates_j": json.dumps({
-                "TileStates": []
-            }),
-            "Default:ZoneInstanceId_s": "",
-            "urn:epic:cfg:accepting-members_b": "true",
-            "urn:epic:cfg:build-id_s": "1:3:",
-            "urn:epic:cfg:can-join_b": "true",
-            "urn:epic:cfg:chat-enabled_b": "true",
-            "urn:epic:cfg:invite-perm_s": "Anyone",
-            "urn:epic:cfg:join-request-action_s": "Manual",
-            "urn:epic:cfg:party-type-id_s": "default",
-            "urn:epic:cfg:presence-perm_s": "Anyone",
-            "VoiceChat:implementation_s": "EOSVoiceChat",
-            "Default:CreativeInGameReadyCheckStatus_s": "None"
-            # "Default:PreferredPrivacy_s": "NoFill"
-        }
+        self.schema = dict(_PARTY_META_DEFAULTS)
+        self.set_prop('Default:PrivacySettings_j', {
+            'PrivacySettings': privacy_settings,
+        })
 
         if meta is not None:
             self.update(meta, raw=True)
@@ -1463,7 +1601,7 @@ class PartyMeta(MetaBase):
 
     @property
     def playlist_info(self) -> Tuple[str]:
-        base = self.get_prop('Default:SelectedIsland_j')
+        base = self._get_json('Default:SelectedIsland_j')
         info = base['SelectedIsland']
 
         return (info['linkId']['mnemonic'],
@@ -1479,25 +1617,19 @@ class PartyMeta(MetaBase):
 
     @property
     def privacy(self) -> Optional[PartyPrivacy]:
-        raw = self.get_prop('Default:PrivacySettings_j')
+        raw = self._get_json('Default:PrivacySettings_j')
         curr_priv = raw['PrivacySettings']
 
-        for privacy in PartyPrivacy:
-            if curr_priv['partyType'] != privacy.value['partyType']:
-                continue
-
-            try:
-                if (curr_priv['partyInviteRestriction']
-                        != privacy.value['partyInviteRestriction']):
-                    continue
-
-                if (curr_priv['bOnlyLeaderFriendsCanJoin']
-                        != privacy.value['bOnlyLeaderFriendsCanJoin']):
-                    continue
-            except KeyError:
-                pass
-
-            return privacy
+        try:
+            return _PRIVACY_LOOKUP[(
+                curr_priv['partyType'],
+                curr_priv.get('partyInviteRestriction'),
+                curr_priv.get('bOnlyLeaderFriendsCanJoin'),
+            )]
+        except KeyError:
+            # Unknown combinations resolve to the first privacy with the
+            # same party type like before the exact lookup was added.
+            return _PRIVACY_BY_TYPE.get(curr_priv['partyType'])
 
     @property
     def squad_assignments(self) -> List[dict]:
@@ -1508,28 +1640,23 @@ class PartyMeta(MetaBase):
         final = {
             "SquadInformation": {
                 "rawSquadAssignments": data,
-                "squadData": [
-                    {
-                        "jamTempo": 0,
-                        "jamKey": 0,
-                        "jamMode": 0
-                    }
-                ]
+                "squadData": _SQUAD_DATA_DEFAULT,
             }
         }
         key = 'Default:SquadInformation_j'
-        return {key: self.set_prop(key, final)}
+        return self.patch_prop(key, final)
     
     def set_playlist(self, playlist: str, version: int) -> Dict[str, Any]:
-        data = (self.get_prop('Default:SelectedIsland_j'))
+        key = 'Default:SelectedIsland_j'
+        island = dict(self._get_json(key)['SelectedIsland'])
+        link_id = island['linkId'] = dict(island['linkId'])
 
         if playlist:
-            data['SelectedIsland']['linkId']['mnemonic'] = playlist
+            link_id['mnemonic'] = playlist
         if version:
-            data['SelectedIsland']['linkId']['version'] = version
+            link_id['version'] = version
 
-        key = 'Default:SelectedIsland_j'
-        return {key: self.set_prop(key, data)}
+        return self.patch_prop(key, {'SelectedIsland': island}, owned=True)
 
     def set_region(self, region: Region) -> Dict[str, Any]:
         key = 'Default:RegionId_s'
@@ -1541,27 +1668,28 @@ class PartyMeta(MetaBase):
 
     def set_fill(self, val: str) -> Dict[str, Any]:
         key = 'Default:AthenaSquadFill_b'
-        return {key: self.set_prop(key, (str(val)).lower())}
+        return {key: self.set_prop(key, val)}
 
     def set_privacy(self, privacy: dict) -> Tuple[dict, list]:
         updated = {}
         deleted = []
         config = {}
+        party_type = privacy['partyType']
 
-        p = self.get_prop('Default:PrivacySettings_j')
+        p = self._get_json('Default:PrivacySettings_j')
         if p:
-            _priv = privacy
-            new_privacy = {
-                **p['PrivacySettings'],
-                'partyType': _priv['partyType'],
-                'bOnlyLeaderFriendsCanJoin': _priv['onlyLeaderFriendsCanJoin'],
-                'partyInviteRestriction': _priv['inviteRestriction'],
-            }
+            new_privacy = p['PrivacySettings'].copy()
+            new_privacy['partyType'] = party_type
+            new_privacy['bOnlyLeaderFriendsCanJoin'] = (
+                privacy['onlyLeaderFriendsCanJoin']
+            )
+            new_privacy['partyInviteRestriction'] = (
+                privacy['inviteRestriction']
+            )
 
-            key = 'Default:PrivacySettings_j'
-            updated[key] = self.set_prop(key, {
+            updated.update(self.patch_prop('Default:PrivacySettings_j', {
                 'PrivacySettings': new_privacy
-            })
+            }))
 
         updated['urn:epic:cfg:presence-perm_s'] = self.set_prop(
             'urn:epic:cfg:presence-perm_s',
@@ -1570,7 +1698,7 @@ class PartyMeta(MetaBase):
 
         updated['urn:epic:cfg:accepting-members_b'] = self.set_prop(
             'urn:epic:cfg:accepting-members_b',
-            str(privacy['acceptingMembers']).lower(),
+            privacy['acceptingMembers'],
         )
 
         updated['urn:epic:cfg:invite-perm_s'] = self.set_prop(
@@ -1578,12 +1706,12 @@ class PartyMeta(MetaBase):
             privacy['invitePermission'],
         )
 
-        if privacy['partyType'] not in ('Public', 'FriendsOnly'):
+        if party_type not in _OPEN_PARTY_TYPES:
             deleted.append(
                 self.delete_prop('urn:epic:cfg:not-accepting-members')
             )
 
-        if privacy['partyType'] == 'Private':
+        if party_type == 'Private':
             updated['urn:epic:cfg:not-accepting-members-reason_i'] = 7
             config['discoverability'] = PartyDiscoverability.INVITED_ONLY.value
             config['joinability'] = PartyJoinability.INVITE_AND_FORMER.value
@@ -1605,9 +1733,17 @@ class PartyMeta(MetaBase):
 
 
 class PartyMemberBase(User):
+    __slots__ = ('_party', '_assignment_version', '_joined_at', 'meta',
+                 'connection', 'role', '_role_updated_at', 'revision')
+
     def __init__(self, client: 'Client',
                  party: 'PartyBase',
                  data: str) -> None:
+        # Set before super().__init__() since that calls _update() which
+        # in turn calls update_role().
+        self.role = None
+        self._role_updated_at = _utcnow()
+
         super().__init__(client=client, data=data)
 
         self._party = party
@@ -1649,16 +1785,14 @@ class PartyMemberBase(User):
         | 8-11 = Team 3
         | 12-15 = Team 4
         """
-        member = self.party.get_member(self.id)
-        return self.party.squad_assignments[member].position
+        return self.party.squad_assignments[self].position
 
     @property
     def hidden(self) -> bool:
         """:class:`bool`: Whether or not the member is currently hidden in the
         party. A member can only be hidden if a bot is the leader, therefore
         this attribute rarely is used."""
-        member = self.party.get_member(self.id)
-        return self.party.squad_assignments[member].hidden
+        return self.party.squad_assignments[self].hidden
 
     @property
     def platform(self) -> Platform:
@@ -1667,7 +1801,7 @@ class PartyMemberBase(User):
             'urn:epic:conn:platform_s',
             self.meta.platform
         )
-        return Platform(val)
+        return _get_platform(val)
 
     @property
     def will_yield_leadership(self) -> bool:
@@ -1703,7 +1837,7 @@ class PartyMemberBase(User):
     @property
     def ready(self) -> ReadyState:
         """:class:`ReadyState`: The members ready state."""
-        return ReadyState(self.meta.ready)
+        return _get_ready_state(self.meta.ready)
 
     @property
     def input(self) -> str:
@@ -1723,57 +1857,35 @@ class PartyMemberBase(User):
         """:class:`str`: The BID of the backpack this member currently has equipped.
         ``None`` if no backpack is equipped.
         """
-        asset = self.meta.backpack
-        if '/petcarriers/' not in asset.lower():
-            result = re.search(r".*\.([^\'\"]*)", asset.strip("'"))
-
-            if result is not None and result.group(1) != 'None':
-                return result.group(1)
+        return _get_backpack_and_pet(self.meta.backpack)[0]
 
     @property
     def pet(self) -> str:
         """:class:`str`: The ID of the pet this member currently has equipped.
         ``None`` if no pet is equipped.
         """
-        asset = self.meta.backpack
-        if '/petcarriers/' in asset.lower():
-            result = re.search(r".*\.([^\'\"]*)", asset.strip("'"))
-
-            if result is not None and result.group(1) != 'None':
-                return result.group(1)
+        return _get_backpack_and_pet(self.meta.backpack)[1]
 
     @property
     def pickaxe(self) -> str:
         """:class:`str`: The pickaxe id of the pickaxe this member currently
         has equipped.
         """
-        asset = self.meta.pickaxe
-        result = re.search(r".*\.([^\'\"]*)", asset.strip("'"))
-
-        if result is not None and result.group(1) != 'None':
-            return result.group(1)
+        return _get_asset_id(self.meta.pickaxe)
 
     @property
     def contrail(self) -> str:
         """:class:`str`: The contrail id of the contrail this member currently
         has equipped.
         """
-        asset = self.meta.contrail
-        result = re.search(r".*\.([^\'\"]*)", asset.strip("'"))
-
-        if result is not None and result[1] != 'None':
-            return result.group(1)
+        return _get_asset_id(self.meta.contrail)
 
     @property
     def kicks(self) -> str:
         """:class:`str`: The kicks id of the kicks this member currently
         has equipped.
         """
-        asset = self.meta.kicks
-        result = re.search(r".*\.([^\'\"]*)", asset.strip("'"))
-
-        if result is not None and result[1] != 'None':
-            return result.group(1)
+        return _get_asset_id(self.meta.kicks)
 
     @property
     def outfit_variants(self) -> List[Dict[str, str]]:
@@ -1836,24 +1948,30 @@ class PartyMemberBase(User):
         """List[:class:`tuple`]: A list of tuples containing the
         enlightenments of this member.
         """
-        return [tuple(d.values()) for d in self.meta.scratchpad]
+        return [_get_enlightenment(d) for d in self.meta._get_scratchpad()]
 
     @property
     def corruption(self) -> Optional[float]:
         """Optional[float]: The corruption value this member is using. ``None``
         if no corruption value is set.
         """
-        data = self.meta.custom_data_store
-        if data:
-            for variants in self.meta.variants.values():
-                inner = variants.get('i', [])
-                for variant in inner:
-                    if variant['c'] == 'Corruption':
-                        for stored in data:
-                            try:
-                                return float(stored)
-                            except ValueError:
-                                pass
+        data = self.meta._get_custom_data_store()
+        if not data:
+            return None
+
+        has_corruption = any(
+            variant['c'] == 'Corruption'
+            for variants in self.meta._get_variants().values()
+            for variant in variants.get('i', ())
+        )
+        if not has_corruption:
+            return None
+
+        for stored in data:
+            try:
+                return float(stored)
+            except ValueError:
+                pass
 
     @property
     def has_crown(self) -> bool:
@@ -1888,10 +2006,7 @@ class PartyMemberBase(User):
         """
         asset = self.meta.emote
         if '/emoji/' not in asset.lower():
-            result = re.search(r".*\.([^\'\"]*)", asset.strip("'"))
-
-            if result is not None and result.group(1) != 'None':
-                return result.group(1)
+            return _get_asset_id(asset)
 
     @property
     def emoji(self) -> Optional[str]:
@@ -1900,10 +2015,7 @@ class PartyMemberBase(User):
         """
         asset = self.meta.emote
         if '/emoji/' in asset.lower():
-            result = re.search(r".*\.([^\'\"]*)", asset.strip("'"))
-
-            if result is not None and result.group(1) != 'None':
-                return result.group(1)
+            return _get_asset_id(asset)
 
     @property
     def banner(self) -> Tuple[str, str, int]:
@@ -1942,10 +2054,10 @@ class PartyMemberBase(User):
         """Optional[:class:`datetime.datetime`]: The time in UTC that
         the members match started. ``None`` if not in a match.
         """
-        if not self.in_match:
+        if not self.in_match():
             return None
 
-        return from_iso(self.meta.match_started_at)
+        return _match_started_at_from_iso(self.meta.match_started_at)
 
     @property
     def match_players_left(self) -> int:
@@ -1997,14 +2109,11 @@ class PartyMemberBase(User):
         return self.ready is ReadyState.READY
 
     def _update_connection(self, data: Optional[Union[list, dict]]) -> None:
-        if data:
-            if isinstance(data, list):
-                for connection in data:
-                    if 'disconnected_at' not in connection:
-                        data = connection
-                        break
-                else:
-                    data = data[0]
+        if data and isinstance(data, list):
+            data = next(
+                (c for c in data if 'disconnected_at' not in c),
+                data[0]
+            )
 
         self.connection = data or {}
 
@@ -2017,17 +2126,27 @@ class PartyMemberBase(User):
         self._update_connection(connections)
 
     def update(self, data: dict) -> None:
-        if data['revision'] > self.revision:
-            self.revision = data['revision']
+        # Updates with a revision we already have are either duplicates or
+        # older than the current meta so applying them would only make the
+        # meta stale.
+        if data['revision'] <= self.revision:
+            return
+
+        self.revision = data['revision']
         self.meta.update(data['member_state_updated'], raw=True)
         self.meta.remove(data['member_state_removed'])
 
     def update_role(self, role: str) -> None:
+        # _role_updated_at tracks when the role last changed so an unchanged
+        # role in a member update doesn't need a new timestamp.
+        if role == self.role:
+            return
+
         self.role = role
-        self._role_updated_at = datetime.datetime.utcnow()
+        self._role_updated_at = _utcnow()
 
     @staticmethod
-    def create_variant(*, config_overrides: Dict[str, str] = {},
+    def create_variant(*, config_overrides: Optional[Dict[str, str]] = None,
                        **kwargs: Any) -> List[Dict[str, Union[str, int]]]:
         """Creates the variants list by the variants you set.
 
@@ -2059,7 +2178,7 @@ class PartyMemberBase(User):
 
         Parameters
         ----------
-        config_overrides: Dict[:class:`str`, :class:`str`]
+        config_overrides: Optional[Dict[:class:`str`, :class:`str`]]
             A config that overrides the default config for the variant
             backend names. Example: ::
 
@@ -2096,28 +2215,24 @@ class PartyMemberBase(User):
         List[:class:`dict`]
             List of dictionaries including all variants data.
         """
-        default_config = {
-            'pattern': 'Mat{}',
-            'numeric': 'Numeric.{}',
-            'clothing_color': 'Mat{}',
-            'jersey_color': 'Color.{}',
-            'parts': 'Stage{}',
-            'progressive': 'Stage{}',
-            'particle': 'Emissive{}',
-            'material': 'Mat{}',
-            'emissive': 'Emissive{}',
-            'profile_banner': '{}',
-        }
-        config = {**default_config, **config_overrides}
+        if config_overrides:
+            config = {**_VARIANT_CONFIG, **config_overrides}
+        else:
+            config = _VARIANT_CONFIG
 
         data = []
         for channel, value in kwargs.items():
+            try:
+                name = _VARIANT_CHANNEL_NAMES[channel]
+            except KeyError:
+                name = ''.join(x.capitalize() for x in channel.split('_'))
+
             v = {
-                'c': ''.join(x.capitalize() for x in channel.split('_')),
+                'c': name,
                 'dE': 0,
             }
 
-            if channel == 'JerseyColor':
+            if channel == 'jersey_color':
                 v['v'] = config[channel].format(value.upper())
             else:
                 v['v'] = config[channel].format(value)
@@ -2138,6 +2253,8 @@ class PartyMember(PartyMemberBase):
         The client.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: 'Client',
                  party: 'PartyBase',
                  data: dict) -> None:
@@ -2227,8 +2344,7 @@ class PartyMember(PartyMemberBase):
             target_id=self.id,
         )
 
-        if not me.edit_lock.locked():
-            return await me.patch(updated=prop)
+        return await me._maybe_patch(prop)
 
 
 class ClientPartyMember(PartyMemberBase, Patchable):
@@ -2240,18 +2356,24 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         The client.
     """
 
+    __slots__ = ('_default_config', 'clear_emote_handle', 'clear_emote_task',
+                 'clear_in_match_task', '_config_cache', 'patch_lock',
+                 'edit_lock', '_pending_patch', '_dummy')
+
     CONN_TYPE = 'game'
 
     def __init__(self, client: 'Client',
                  party: 'PartyBase',
                  data: dict) -> None:
         self._default_config = client.default_party_member_config
+        self.clear_emote_handle = None
         self.clear_emote_task = None
         self.clear_in_match_task = None
 
         self._config_cache = {}
         self.patch_lock = asyncio.Lock()
         self.edit_lock = asyncio.Lock()
+        self._pending_patch = None
         self._dummy = False
 
         super().__init__(client, party, data)
@@ -2406,12 +2528,61 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         state: :class:`ReadyState`
             The ready state you wish to set.
         """
+        if self.meta.ready == state.value:
+            return
+
         prop = self.meta.set_lobby_state(
             game_readiness=state.value
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
+
+    async def _set_cosmetic(self, slot: str,
+                            asset: Optional[str] = None, *,
+                            key: Optional[str] = None,
+                            variants: Optional[List[Dict[str, str]]] = None,
+                            enlightenment: Optional[Union[List, Tuple]] = None,
+                            corruption: Optional[float] = None
+                            ) -> None:
+        kwarg, resolve, current, variants_slot, corruptible = \
+            _COSMETIC_SLOTS[slot]
+
+        if asset is not None:
+            if asset != '' and '.' not in asset:
+                asset = resolve(asset)
+        else:
+            asset = getattr(self.meta, current)
+
+        if enlightenment is not None:
+            if len(enlightenment) != 2:
+                raise ValueError('enlightenment has to be a list/tuple with '
+                                 'exactly two int/float values.')
+            else:
+                enlightenment = [
+                    {
+                        't': enlightenment[0],
+                        'v': enlightenment[1]
+                    }
+                ]
+
+        if corruptible:
+            if corruption is not None:
+                corruption = [f'{corruption:.4f}']
+                variants = [_CORRUPTION_VARIANT, *(variants or ())]
+            else:
+                corruption = self.meta.custom_data_store
+
+        updated = self.meta.set_cosmetic_loadout(
+            **{kwarg: asset, kwarg + '_ekey': key},
+            scratchpad=enlightenment
+        )
+        if variants_slot is not None:
+            updated.update(self.meta.set_slot_variants(variants_slot,
+                                                       variants))
+        if corruptible:
+            updated.update(self.meta.set_custom_data_store(value=corruption))
+
+        return await self._maybe_patch(updated)
 
     async def set_outfit(self, asset: Optional[str] = None, *,
                          key: Optional[str] = None,
@@ -2466,56 +2637,10 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
-        if asset is not None:
-            if asset != '' and '.' not in asset:
-                asset = f'AthenaCharacter:{asset}'
-        else:
-            prop = self.meta.get_prop('Default:AthenaCosmeticLoadout_j')
-            asset = prop['AthenaCosmeticLoadout']['characterPrimaryAssetId']
-
-        if enlightenment is not None:
-            if len(enlightenment) != 2:
-                raise ValueError('enlightenment has to be a list/tuple with '
-                                 'exactly two int/float values.')
-            else:
-                enlightenment = [
-                    {
-                        't': enlightenment[0],
-                        'v': enlightenment[1]
-                    }
-                ]
-
-        if corruption is not None:
-            corruption = ['{:.4f}'.format(corruption)]
-            variants = [
-                {'c': "Corruption", 'v': 'FloatSlider', 'dE': 1}
-            ] + (variants or [])
-        else:
-            corruption = self.meta.custom_data_store
-
-        current = self.meta.variants
-        if variants is not None:
-            current['AthenaCharacter'] = {'i': variants}
-        else:
-            try:
-                del current['AthenaCharacter']
-            except KeyError:
-                pass
-
-        prop = self.meta.set_cosmetic_loadout(
-            character=asset,
-            character_ekey=key,
-            scratchpad=enlightenment
-        )
-        prop2 = self.meta.set_variants(
-            variants=current
+        return await self._set_cosmetic(
+            'outfit', asset, key=key, variants=variants,
+            enlightenment=enlightenment, corruption=corruption
         )
-        prop3 = self.meta.set_custom_data_store(
-            value=corruption
-        )
-
-        if not self.edit_lock.locked():
-            return await self.patch(updated={**prop, **prop2, **prop3})
 
     async def set_backpack(self, asset: Optional[str] = None, *,
                            key: Optional[str] = None,
@@ -2572,57 +2697,11 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
-        if asset is not None:
-            if asset != '' and '.' not in asset:
-                asset = f'/BRCosmetics/Athena/Items/Cosmetics/Backpacks/{asset}.{asset}'
-        else:
-            prop = self.meta.get_prop('Default:AthenaCosmeticLoadout_j')
-            asset = prop['AthenaCosmeticLoadout']['backpackDef']
-
-        if enlightenment is not None:
-            if len(enlightenment) != 2:
-                raise ValueError('enlightenment has to be a list/tuple with '
-                                 'exactly two int/float values.')
-            else:
-                enlightenment = [
-                    {
-                        't': enlightenment[0],
-                        'v': enlightenment[1]
-                    }
-                ]
-
-        if corruption is not None:
-            corruption = ['{:.4f}'.format(corruption)]
-            variants = [
-                {'c': "Corruption", 'v': 'FloatSlider', 'dE': 1}
-            ] + (variants or [])
-        else:
-            corruption = self.meta.custom_data_store
-
-        current = self.meta.variants
-        if variants is not None:
-            current['AthenaBackpack'] = {'i': variants}
-        else:
-            try:
-                del current['AthenaBackpack']
-            except KeyError:
-                pass
-
-        prop = self.meta.set_cosmetic_loadout(
-            backpack=asset,
-            backpack_ekey=key,
-            scratchpad=enlightenment
-        )
-        prop2 = self.meta.set_variants(
-            variants=current
-        )
-        prop3 = self.meta.set_custom_data_store(
-            value=corruption
+        return await self._set_cosmetic(
+            'backpack', asset, key=key, variants=variants,
+            enlightenment=enlightenment, corruption=corruption
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated={**prop, **prop2, **prop3})
-
     async def clear_backpack(self) -> None:
         """|coro|
 
@@ -2666,32 +2745,9 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
-        if asset is not None:
-            if asset != '' and '.' not in asset:
-                asset = f'/BRCosmetics/Athena/Items/Cosmetics/PetCarriers/{asset}.{asset}'
-        else:
-            prop = self.meta.get_prop('Default:AthenaCosmeticLoadout_j')
-            asset = prop['AthenaCosmeticLoadout']['backpackDef']
-
-        new = self.meta.variants
-        if variants is not None:
-            new['AthenaBackpack'] = {'i': variants}
-        else:
-            try:
-                del new['AthenaBackpack']
-            except KeyError:
-                pass
-
-        prop = self.meta.set_cosmetic_loadout(
-            backpack=asset,
-            backpack_ekey=key,
+        return await self._set_cosmetic(
+            'pet', asset, key=key, variants=variants
         )
-        prop2 = self.meta.set_variants(
-            variants=new
-        )
-
-        if not self.edit_lock.locked():
-            return await self.patch(updated={**prop, **prop2})
 
     async def clear_pet(self) -> None:
         """|coro|
@@ -2736,33 +2792,10 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
-        if asset is not None:
-            if asset != '' and '.' not in asset:
-                asset = f'/BRCosmetics/Athena/Items/Cosmetics/PickAxes/{asset}.{asset}'
-        else:
-            prop = self.meta.get_prop('Default:AthenaCosmeticLoadout_j')
-            asset = prop['AthenaCosmeticLoadout']['pickaxeDef']
-
-        new = self.meta.variants
-        if variants is not None:
-            new['AthenaPickaxe'] = {'i': variants}
-        else:
-            try:
-                del new['AthenaPickaxe']
-            except KeyError:
-                pass
-
-        prop = self.meta.set_cosmetic_loadout(
-            pickaxe=asset,
-            pickaxe_ekey=key,
-        )
-        prop2 = self.meta.set_variants(
-            variants=new
+        return await self._set_cosmetic(
+            'pickaxe', asset, key=key, variants=variants
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated={**prop, **prop2})
-
     async def set_contrail(self, asset: Optional[str] = None, *,
                            key: Optional[str] = None,
                            variants: Optional[List[Dict[str, str]]] = None
@@ -2794,32 +2827,9 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
-        if asset is not None:
-            if asset != '' and '.' not in asset:
-                asset = f'/BRCosmetics/Athena/Items/Cosmetics/Contrails/{asset}.{asset}'
-        else:
-            prop = self.meta.get_prop('Default:AthenaCosmeticLoadout_j')
-            asset = prop['AthenaCosmeticLoadout']['contrailDef']
-
-        new = self.meta.variants
-        if variants is not None:
-            new['AthenaContrail'] = {'i': variants}
-        else:
-            try:
-                del new['AthenaContrail']
-            except KeyError:
-                pass
-
-        prop = self.meta.set_cosmetic_loadout(
-            contrail=asset,
-            contrail_ekey=key,
+        return await self._set_cosmetic(
+            'contrail', asset, key=key, variants=variants
         )
-        prop2 = self.meta.set_variants(
-            variants=new
-        )
-
-        if not self.edit_lock.locked():
-            return await self.patch(updated={**prop, **prop2})
 
     async def set_kicks(self,
                         asset: Optional[str] = None, *,
@@ -2849,20 +2859,7 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
-        if asset is not None:
-            if asset != '' and '.' not in asset:
-                asset = f'/CosmeticShoes/Assets/Items/Cosmetics/{asset}.{asset}'
-        else:
-            prop = self.meta.get_prop('Default:AthenaCosmeticLoadout_j')
-            asset = prop['AthenaCosmeticLoadout']['shoesDef']
-
-        prop = self.meta.set_cosmetic_loadout(
-            shoes=asset,
-            shoes_ekey=key,
-        )
-
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._set_cosmetic('kicks', asset, key=key)
 
     async def clear_kicks(self) -> None:
         """|coro|
@@ -2892,12 +2889,14 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
+        if self.meta.has_crown == int(hold_crown):
+            return
+
         prop = self.meta.set_cosmetic_loadout(
             has_crown=int(hold_crown)
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def set_victory_crowns(self, crowns: int = 0) -> None:
         """|coro|
@@ -2915,12 +2914,14 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
+        if self.meta.victory_crowns == crowns:
+            return
+
         prop = self.meta.set_cosmetic_loadout(
             victory_crowns=crowns
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def clear_contrail(self) -> None:
         """|coro|
@@ -2968,7 +2969,7 @@ class ClientPartyMember(PartyMemberBase, Patchable):
             An error occurred while requesting.
         """
         if asset != '' and '.' not in asset:
-            asset = f'/BRCosmetics/Athena/Items/Cosmetics/Dances/{asset}.{asset}'
+            asset = _asset_path(_EMOTE_PATH, asset)
 
         prop = self.meta.set_emote(
             emote=asset,
@@ -2978,12 +2979,12 @@ class ClientPartyMember(PartyMemberBase, Patchable):
 
         self._cancel_clear_emote()
         if run_for is not None:
-            self.clear_emote_task = self.client.loop.create_task(
-                self._schedule_clear_emote(run_for)
+            self.clear_emote_handle = self.client.loop.call_later(
+                run_for,
+                self._trigger_clear_emote
             )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def set_jam_emote(self, asset: str, *,
                             run_for: Optional[float] = None,
@@ -3021,7 +3022,7 @@ class ClientPartyMember(PartyMemberBase, Patchable):
             An error occurred while requesting.
         """
         if asset != '' and '.' not in asset:
-            asset = f'/SparksSongTemplates/Items/JamEmotes/{asset}.{asset}'
+            asset = _asset_path(_JAM_EMOTE_PATH, asset)
 
         prop = self.meta.set_emote(
             emote=asset,
@@ -3031,12 +3032,12 @@ class ClientPartyMember(PartyMemberBase, Patchable):
 
         self._cancel_clear_emote()
         if run_for is not None:
-            self.clear_emote_task = self.client.loop.create_task(
-                self._schedule_clear_emote(run_for)
+            self.clear_emote_handle = self.client.loop.call_later(
+                run_for,
+                self._trigger_clear_emote
             )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def set_emoji(self, asset: str, *,
                         run_for: Optional[float] = 2,
@@ -3076,7 +3077,7 @@ class ClientPartyMember(PartyMemberBase, Patchable):
             An error occurred while requesting.
         """
         if asset != '' and '.' not in asset:
-            asset = f'/BRCosmetics/Athena/Items/Cosmetics/Dances/Emoji/{asset}.{asset}'
+            asset = _asset_path(_EMOJI_PATH, asset)
 
         prop = self.meta.set_emote(
             emote=asset,
@@ -3086,22 +3087,35 @@ class ClientPartyMember(PartyMemberBase, Patchable):
 
         self._cancel_clear_emote()
         if run_for is not None:
-            self.clear_emote_task = self.client.loop.create_task(
-                self._schedule_clear_emote(run_for)
+            self.clear_emote_handle = self.client.loop.call_later(
+                run_for,
+                self._trigger_clear_emote
             )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     def _cancel_clear_emote(self) -> None:
-        if (self.clear_emote_task is not None
-                and not self.clear_emote_task.cancelled()):
-            self.clear_emote_task.cancel()
-
-    async def _schedule_clear_emote(self, seconds: Union[int, float]) -> None:
-        await asyncio.sleep(seconds)
-        self.clear_emote_task = None
+        if self.clear_emote_handle is not None:
+            self.clear_emote_handle.cancel()
+            self.clear_emote_handle = None
+
+        # A clear that already fired might still be patching, it must not
+        # wipe the emote that is being set now. clear_emote() calls this
+        # from within the task itself so it is skipped there.
+        task = self.clear_emote_task
+        if (task is not None and not task.done()
+                and task is not asyncio.current_task()):
+            task.cancel()
+            self.clear_emote_task = None
+
+    def _trigger_clear_emote(self) -> None:
+        # Only the clear itself runs as a task, no task sleeps for run_for.
+        self.clear_emote_handle = None
+        self.clear_emote_task = self.client.loop.create_task(
+            self._run_clear_emote()
+        )
 
+    async def _run_clear_emote(self) -> None:
         try:
             await self.clear_emote()
         except HTTPException as exc:
@@ -3128,8 +3142,7 @@ class ClientPartyMember(PartyMemberBase, Patchable):
 
         self._cancel_clear_emote()
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def set_banner(self, icon: Optional[str] = None,
                          color: Optional[str] = None,
@@ -3155,14 +3168,16 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
+        if _is_unchanged((icon, color, season_level), self.meta.banner):
+            return
+
         prop = self.meta.set_banner(
             banner_icon=icon,
             banner_color=color,
             season_level=season_level
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def set_battlepass_info(self, has_purchased: Optional[bool] = None,
                                   level: Optional[int] = None
@@ -3193,13 +3208,15 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
+        if _is_unchanged((has_purchased, level), self.meta.battlepass_info):
+            return
+
         prop = self.meta.set_battlepass_info(
             has_purchased=has_purchased,
             level=level
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def set_position(self, position: int) -> None:
         """|coro|
@@ -3223,14 +3240,9 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         if position < 0 or position > 15:
             raise ValueError('The passed position is out of bounds.')
 
-        target_id = None
-        for member, assignment in self.party.squad_assignments.items():
-            if assignment.position == position:
-                if member.id == self.id:
-                    return
-
-                target_id = member.id
-                break
+        target_id = self.party._position_index.get(position)
+        if target_id == self.id:
+            return
 
         version = self._assignment_version + 1
         prop = self.meta.set_member_squad_assignment_request(
@@ -3240,8 +3252,7 @@ class ClientPartyMember(PartyMemberBase, Patchable):
             target_id=target_id,
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def set_in_match(self) -> None:
         """|coro|
@@ -3258,13 +3269,14 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """  # noqa
+        if self.meta.location == 'InGame':
+            return
 
         prop = self.meta.set_match_state(
             location='InGame'
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def clear_in_match(self) -> None:
         """|coro|
@@ -3276,12 +3288,14 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
+        if self.meta.location == 'PreLobby':
+            return
+
         prop = self.meta.set_match_state(
             location='PreLobby'
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def set_lobby_map_marker(self, x: float, y: float) -> None:
         """|coro|
@@ -3302,14 +3316,17 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
+        if (self.meta.frontend_marker_set
+                and self.meta.frontend_marker_location == (x, y)):
+            return
+
         prop = self.meta.set_frontend_marker(
             x=x,
             y=y,
             is_set=True,
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def clear_lobby_map_marker(self) -> None:
         """|coro|
@@ -3327,8 +3344,7 @@ class ClientPartyMember(PartyMemberBase, Patchable):
             is_set=False,
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(prop)
 
     async def request_playlist(self, playlist_id: str) -> None:
         """|coro|
@@ -3345,24 +3361,23 @@ class ClientPartyMember(PartyMemberBase, Patchable):
             playlist_id=playlist_id
         )
 
-        if not self.edit_lock.locked():
-            await self.patch(updated=prop)
+        await self._maybe_patch(prop)
 
+        waiters = self.party._playlist_waiters
+        waiter = waiters.setdefault(playlist_id, asyncio.Event())
         try:
-            await self.client.wait_for(
-                event='party_playlist_change',
-                check=lambda party, before, after: after[0] == playlist_id,
-                timeout=5
-            )
+            await asyncio.wait_for(waiter.wait(), timeout=5)
         except asyncio.TimeoutError:
             pass
         finally:
+            if waiters.get(playlist_id) is waiter:
+                del waiters[playlist_id]
+
             prop = self.meta.set_requested_playlist(
                 playlist_id=''
             )
 
-            if not self.edit_lock.locked():
-                return await self.patch(updated=prop)
+            return await self._maybe_patch(prop)
 
     async def set_instruments(self,
                               bass: Optional[str] = None,
@@ -3408,6 +3423,9 @@ class ClientPartyMember(PartyMemberBase, Patchable):
         HTTPException
             An error occurred while requesting.
         """
+        key = 'Default:MpLoadout_j'
+        before = self.meta.schema.get(key)
+
         prop = self.meta.set_instruments(
             bass=bass,
             bass_variants=bass_variants,
@@ -3421,17 +3439,28 @@ class ClientPartyMember(PartyMemberBase, Patchable):
             microphone_variants=microphone_variants
         )
 
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        # Only the passed instruments are changed, nothing to send if they
+        # were all None or already set.
+        if prop[key] == before:
+            return
+
+        return await self._maybe_patch(prop)
 
 
 class PartyBase:
+    __slots__ = ('_client', '_id', '_members', '_applicants',
+                 '_squad_assignments', '_position_index', '_leader_id',
+                 'invites', 'join_confirmation', 'max_size',
+                 'invite_ttl_seconds', 'sub_type', 'config', 'meta')
+
     def __init__(self, client: 'Client', data: dict) -> None:
         self._client = client
         self._id = data.get('id')
         self._members = {}
         self._applicants = data.get('applicants', [])
-        self._squad_assignments = OrderedDict()
+        self._squad_assignments = {}
+        self._position_index = {}
+        self._leader_id = None
 
         self._update_invites(data.get('invites', []))
         self._update_config(data.get('config'))
@@ -3475,8 +3504,15 @@ class PartyBase:
     @property
     def leader(self) -> PartyMember:
         """:class:`PartyMember`: The leader of the party."""
+        # Roles can also change through member updates, so the cached id is
+        # checked and the members are only scanned when it's stale.
+        member = self._members.get(self._leader_id)
+        if member is not None and member.leader:
+            return member
+
         for member in self._members.values():
             if member.leader:
+                self._leader_id = member.id
                 return member
 
     @property
@@ -3533,7 +3569,12 @@ class PartyBase:
     def _remove_member(self, user_id: str) -> PartyMember:
         if not isinstance(user_id, str):
             user_id = user_id.id
-        return self._members.pop(user_id)
+        member = self._members.pop(user_id)
+        self._on_member_removed()
+        return member
+
+    def _on_member_removed(self) -> None:
+        pass
 
     def get_member(self, user_id: str) -> Optional[PartyMember]:
         """Optional[:class:`PartyMember`]: Attempts to get a party member
@@ -3543,16 +3584,30 @@ class PartyBase:
         return self._members.get(user_id)
 
     def _update_squad_assignments(self, raw: dict) -> None:
-        results = OrderedDict()
-        for data in sorted(raw, key=lambda o: o['absoluteMemberIdx']):
-            member = self.get_member(data['memberId'])
-            if member is None:
-                continue
+        # Drop assignments of unknown members before sorting what's left.
+        members = self._members
+        found = []
+        for data in raw:
+            member = members.get(data['memberId'])
+            if member is not None:
+                found.append((data['absoluteMemberIdx'], member))
+
+        found.sort(key=operator.itemgetter(0))
+        results = {
+            member: SquadAssignment(position=position)
+            for position, member in found
+        }
 
-            assignment = SquadAssignment(position=data['absoluteMemberIdx'])
-            results[member] = assignment
+        self._store_squad_assignments(results)
 
-        self._squad_assignments = results
+    def _store_squad_assignments(
+            self, assignments: Dict[PartyMember, SquadAssignment]) -> None:
+        self._squad_assignments = assignments
+
+        # position -> member id, used to find the holder of a position.
+        self._position_index = {
+            a.position: m.id for m, a in assignments.items()
+        }
 
     def _update(self, data: dict) -> None:
         try:
@@ -3582,22 +3637,15 @@ class PartyBase:
         if 'party_state_removed' in data:
             self.meta.remove(data['party_state_removed'])
 
-        privacy = self.meta.get_prop('Default:PrivacySettings_j')
+        privacy = self.meta._get_json('Default:PrivacySettings_j')
         c = privacy['PrivacySettings']
-        found = False
-        for d in PartyPrivacy:
-            p = d.value
-            if p['partyType'] != c['partyType']:
-                continue
-            if p['inviteRestriction'] != c['partyInviteRestriction']:
-                continue
-            if p['onlyLeaderFriendsCanJoin'] != c['bOnlyLeaderFriendsCanJoin']:
-                continue
-            found = p
-            break
-
-        if found:
-            self.config['privacy'] = found
+        found = _PRIVACY_LOOKUP.get((
+            c['partyType'],
+            c['partyInviteRestriction'],
+            c['bOnlyLeaderFriendsCanJoin'],
+        ))
+        if found is not None:
+            self.config['privacy'] = found.value
 
         # Only update role if the client is not in the party. This is because
         # we don't want the role being potentially updated before
@@ -3610,7 +3658,7 @@ class PartyBase:
             if captain_id is not None:
                 leader = self.leader
                 if leader is not None and captain_id != leader.id:
-                    delt = datetime.datetime.utcnow() - leader._role_updated_at
+                    delt = _utcnow() - leader._role_updated_at
                     if delt.total_seconds() > 3:
                         member = self.get_member(captain_id)
                         if member is not None:
@@ -3618,16 +3666,18 @@ class PartyBase:
 
         if _update_squad_assignments:
             if self.leader.id != self.client.user.id:
-                _assignments = json.loads(
+                _assignments = json_loads(
                     _assignments
                 )['SquadInformation']['rawSquadAssignments']
                 self._update_squad_assignments(_assignments)
 
     def _update_roles(self, new_leader: PartyMemberBase) -> None:
         for member in self._members.values():
-            member.update_role(None)
+            if member is not new_leader:
+                member.update_role(None)
 
         new_leader.update_role('CAPTAIN')
+        self._leader_id = new_leader.id
 
     def _update_invites(self, invites: list) -> None:
         self.invites = invites
@@ -3652,37 +3702,36 @@ class PartyBase:
             )
             members = data['members']
 
-        def get_id(m):
-            return m.get('account_id', m.get('accountId'))
+        client_user_id = client.user.id
+        get_user = client.get_user
 
         raw_users = {}
-        user_ids = [get_id(m) for m in members]
+        user_ids = [m.get('account_id') or m.get('accountId')
+                    for m in members]
+        missing = []
         for user_id in user_ids:
-            if user_id == client.user.id:
+            if user_id == client_user_id:
                 user = client.user
             else:
-                user = client.get_user(user_id)
+                user = get_user(user_id)
 
             if user is not None:
                 raw_users[user.id] = user.get_raw()
+            elif not fetch_user_data:
+                raw_users[user_id] = {'id': user_id}
             else:
-                if not fetch_user_data:
-                    raw_users[user_id] = {'id': user_id}
-
-        user_ids = [uid for uid in user_ids if uid not in raw_users]
+                missing.append(user_id)
 
-        if user_ids:
+        if missing:
             data = await client.http.account_get_multiple_by_user_id(
-                user_ids,
+                missing,
                 priority=priority
             )
             for account_data in data:
                 raw_users[account_data['id']] = account_data
 
         result = []
-        for raw in members:
-            user_id = get_id(raw)
-
+        for raw, user_id in zip(members, user_ids):
             account_data = raw_users[user_id]
             raw = {**raw, **account_data}
 
@@ -3710,6 +3759,8 @@ class PartyBase:
 class Party(PartyBase):
     """Represent a party that the ClientUser is not yet a part of."""
 
+    __slots__ = ()
+
     def __init__(self, client: 'Client', data: dict) -> None:
         super().__init__(client, data)
 
@@ -3757,11 +3808,42 @@ class Party(PartyBase):
         return await self.client.join_party(self.id)
 
 
+# The parts of the party presence that never change. These are only ever
+# serialized so the same objects are shared by every presence.
+_PRESENCE_STATIC = {
+    'bIsPlaying': False,
+    'bIsJoinable': False,
+    'bHasVoiceSupport': False,
+    'SessionId': '',
+    'ProductName': 'Fortnite',
+}
+_PRESENCE_STATIC_PROPERTIES = {
+    'FortBasicInfo_j': {
+        'homeBaseRating': 1,
+    },
+    'FortLFG_I': '0',
+    'FortPartySize_i': 1,
+    'FortSubGame_i': 1,
+    'InUnjoinableMatch_b': False,
+    'FortGameplayStats_j': {
+        'state': '',
+        'playlist': 'None',
+        'numKills': 0,
+        'bFellToDeath': False,
+    },
+}
+
+
 class ClientParty(PartyBase, Patchable):
     """Represents ClientUser's party."""
 
+    __slots__ = ('last_raw_status', '_last_presence_state', '_me',
+                 'patch_lock', 'edit_lock', '_config_cache', '_default_config',
+                 '_playlist_waiters', '_pending_patch', 'revision')
+
     def __init__(self, client: 'Client', data: dict) -> None:
         self.last_raw_status = None
+        self._last_presence_state = None
         self._me = None
 
         self.patch_lock = asyncio.Lock()
@@ -3769,6 +3851,8 @@ class ClientParty(PartyBase, Patchable):
 
         self._config_cache = {}
         self._default_config = client.default_party_config
+        self._playlist_waiters = {}
+        self._pending_patch = None
         self._update_revision(data.get('revision', 0))
 
         super().__init__(client, data)
@@ -3791,13 +3875,14 @@ class ClientParty(PartyBase, Patchable):
         self._add_clientmember(member)
         return member
 
-    def _remove_member(self, user_id: str) -> PartyMember:
-        if not isinstance(user_id, str):
-            user_id = user_id.id
+    def _on_member_removed(self) -> None:
         self.update_presence()
-        return self._members.pop(user_id)
 
     def construct_presence(self, text: Optional[str] = None) -> dict:
+        client = self.client
+        member_count = len(self._members)
+        max_size = self.max_size
+
         perm = self.config['privacy']['presencePermission']
         if perm == 'Noone' or (perm == 'Leader' and (self.me is not None
                                                      and not self.me.leader)):
@@ -3806,62 +3891,74 @@ class ClientParty(PartyBase, Patchable):
             }
         else:
             join_data = {
-                'sourceId': self.client.user.id,
-                'sourceDisplayName': self.client.user.display_name,
-                'sourcePlatform': self.client.platform.value,
+                'sourceId': client.user.id,
+                'sourceDisplayName': client.user.display_name,
+                'sourcePlatform': client.platform.value,
                 'partyId': self.id,
                 'partyTypeId': 286331153,
                 'key': 'k',
                 'appId': 'Fortnite',
-                'buildId': self.client.party_build_id,
+                'buildId': client.party_build_id,
                 'partyFlags': -2024557306,
                 'notAcceptingReason': 0,
-                'pc': self.member_count,
+                'pc': member_count,
             }
 
-        status = text or self.client.status
+        status = text or client.status
 
         _default_status = {
-            'Status': status.format(party_size=self.member_count,
-                                    party_max_size=self.max_size,
-                                    current_playlist=self.client.
+            'Status': status.format(party_size=member_count,
+                                    party_max_size=max_size,
+                                    current_playlist=client.
                                     current_status_playlist),
-            'bIsPlaying': False,
-            'bIsJoinable': False,
-            'bHasVoiceSupport': False,
-            'SessionId': '',
-            'ProductName': 'Fortnite',
+            **_PRESENCE_STATIC,
             'Properties': {
                 'party.joininfodata.286331153_j': join_data,
-                'FortBasicInfo_j': {
-                    'homeBaseRating': 1,
-                },
-                'FortLFG_I': '0',
-                'FortPartySize_i': 1,
-                'FortSubGame_i': 1,
-                'InUnjoinableMatch_b': False,
-                'FortGameplayStats_j': {
-                    'state': '',
-                    'playlist': 'None',
-                    'numKills': 0,
-                    'bFellToDeath': False,
-                },
+                **_PRESENCE_STATIC_PROPERTIES,
                 'GamePlaylistName_s': self.meta.playlist_info[0],
                 'Event_PlayersAlive_s': '0',
-                'Event_PartySize_s': str(len(self._members)),
-                'Event_PartyMaxSize_s': str(self.max_size),
+                'Event_PartySize_s': str(member_count),
+                'Event_PartyMaxSize_s': str(max_size),
             },
         }
         return _default_status
 
-    def update_presence(self, text: Optional[str] = None) -> None:
-        if self.client.status is not False:
-            data = self.construct_presence(text=text)
+    def update_presence(self, text: Optional[str] = None, *,
+                        force: bool = False) -> None:
+        client = self.client
+        if client.status is not False:
+            show = client.away.value
+            xmpp_client = client.xmpp.xmpp_client
+            me = self.me
+
+            # Most party updates don't touch anything shown in the presence
+            # so there is no reason to build and send the same presence
+            # again. These are the values the presence is built from. The
+            # jid is included since a new xmpp session starts without any
+            # presence set.
+            state = (
+                text or client.status,
+                show,
+                xmpp_client.local_jid if xmpp_client is not None else None,
+                self.config['privacy']['presencePermission'],
+                me is not None and me.leader,
+                self.id,
+                len(self._members),
+                self.max_size,
+                self.meta.playlist_info[0],
+                client.user.display_name,
+                client.platform.value,
+                client.party_build_id,
+                client.current_status_playlist,
+            )
+            if not force and state == self._last_presence_state:
+                return
 
-            self.last_raw_status = data
-            self.client.xmpp.set_presence(
+            self._last_presence_state = state
+            self.last_raw_status = self.construct_presence(text=text)
+            client.xmpp.set_presence(
                 status=self.last_raw_status,
-                show=self.client.away.value,
+                show=show,
             )
 
     def _update(self, data: dict) -> None:
@@ -3897,16 +3994,14 @@ class ClientParty(PartyBase, Patchable):
         if not remove_missing:
             return result
 
-        for member in result:
-            if member.id == self.client.user.id:
-                break
-        else:
+        # _members now holds exactly the members in result.
+        if self.client.user.id not in self._members:
             # There should always be a ClientPartyMember in a ClientParty,
             # therefore we have to create a dummy until the actual
             # ClientPartyMember is added at a later stage. We do this to avoid
             # ClientParty.me being None.
             default_config = self.client.default_party_member_config
-            now = to_iso(datetime.datetime.utcnow())
+            now = to_iso(_utcnow())
             platform_s = self.client.platform.value
             conn_type = default_config.cls.CONN_TYPE
             external_auths = [
@@ -4062,32 +4157,50 @@ class ClientParty(PartyBase, Patchable):
         results = {}
         already_assigned = set()
 
-        positions = self._default_config.position_priorities.copy()
+        # The free positions are tracked in a set while the deque keeps the
+        # priority order. Taken positions are skipped when popping from it.
+        priorities = self._default_config.position_priorities
+        order = deque(priorities)
+        available = set(priorities)
         reassign = self._default_config.reassign_positions_on_size_change
         default_assignment = self._default_config.default_squad_assignment
 
+        get_member = self.get_member
+        mark_assigned = already_assigned.add
+
+        def take_position(position):
+            if position not in available:
+                raise ValueError('Position {0!r} is not available.'.format(
+                    position
+                ))
+            available.discard(position)
+
+        def next_position():
+            while True:
+                position = order.popleft()
+                if position in available:
+                    available.discard(position)
+                    return position
+
         def assign(member, assignment=None, position=True):
             if assignment is None:
-                assignment = SquadAssignment.copy(default_assignment)
+                assignment = copy.copy(default_assignment)
                 position = True
 
-            if str(position) not in ('True', 'False'):
-                assignment.position = position
-                positions.remove(position)
-            elif position:
-                assignment.position = positions.pop(0)
+            if position is True:
+                assignment.position = next_position()
+            elif position is False:
+                available.discard(assignment.position)
             else:
-                try:
-                    positions.remove(assignment.position)
-                except ValueError:
-                    pass
+                assignment.position = position
+                take_position(position)
 
             results[member] = assignment
-            already_assigned.add(member.id)
+            mark_assigned(member.id)
 
         if new_positions is not None:
             for user_id, position in new_positions.items():
-                member = self.get_member(user_id)
+                member = get_member(user_id)
                 if member is None:
                     continue
 
@@ -4098,7 +4211,7 @@ class ClientParty(PartyBase, Patchable):
             for m, assignment in assignments.items():
                 if assignment.position is not None:
                     try:
-                        positions.remove(assignment.position)
+                        take_position(assignment.position)
                     except ValueError:
                         raise ValueError('Duplicate positions set.')
                     else:
@@ -4112,16 +4225,16 @@ class ClientParty(PartyBase, Patchable):
 
             assignment = existing.get(member)
             should_reassign = reassign
-            if assignment and assignment.position not in positions:
+            if assignment and assignment.position not in available:
                 should_reassign = True
 
             assign(member, assignment, position=should_reassign)
 
-        results = OrderedDict(
+        results = dict(
             sorted(results.items(), key=lambda o: o[1].position)
         )
 
-        self._squad_assignments = results
+        self._store_squad_assignments(results)
         return results
 
     def _convert_squad_assignments(self, assignments: dict) -> List[dict]:
@@ -4208,7 +4321,7 @@ class ClientParty(PartyBase, Patchable):
             self,
             self.me,
             self.client.store_user(friend.get_raw()),
-            {'sent_at': datetime.datetime.utcnow()}
+            {'sent_at': _utcnow()}
         )
         return invite
 
@@ -4274,16 +4387,33 @@ class ClientParty(PartyBase, Patchable):
 
         data = await self.client.http.party_lookup(self.id)
 
-        user_ids = (r['sent_to'] for r in data['invites'])
+        raw_invites = data['invites']
+        user_ids = {r['sent_to'] for r in raw_invites}
         users = await self.client.fetch_users(user_ids, cache=True)
 
+        # fetch_users returns cached users first and leaves out users that
+        # weren't found so the result can't be matched up by index.
+        users_by_id = {user.id: user for user in users}
+        members = self._members
+        client = self.client
+        invitation_cls = SentPartyInvitation
+
         invites = []
-        for i, raw in enumerate(data['invites']):
-            invites.append(SentPartyInvitation(
-                self.client,
+        for raw in raw_invites:
+            receiver = users_by_id.get(raw['sent_to'])
+            if receiver is None:
+                receiver = User(client, {'id': raw['sent_to']})
+
+            # The sender might have left the party since sending the invite.
+            sender = members.get(raw['sent_by'])
+            if sender is None:
+                sender = User(client, {'id': raw['sent_by']})
+
+            invites.append(invitation_cls(
+                client,
                 self,
-                self._members[raw['sent_by']],
-                users[i],
+                sender,
+                receiver,
                 raw
             ))
 
@@ -4328,12 +4458,11 @@ class ClientParty(PartyBase, Patchable):
             privacy = privacy.value
 
         updated, deleted, config = self.meta.set_privacy(privacy)
-        if not self.edit_lock.locked():
-            return await self.patch(
-                updated=updated,
-                deleted=deleted,
-                config=config,
-            )
+        return await self._maybe_patch(
+            updated=updated,
+            deleted=deleted,
+            config=config,
+        )
     
     async def set_playlist(self, playlist: str, version: int = -1) -> None:
         """|coro|
@@ -4372,8 +4501,7 @@ class ClientParty(PartyBase, Patchable):
             playlist=playlist,
             version=version
         )
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(updated=prop)
 
     async def set_region(self, region: Region) -> None:
         """|coro|
@@ -4403,8 +4531,7 @@ class ClientParty(PartyBase, Patchable):
         prop = self.meta.set_region(
             region=region,
         )
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(updated=prop)
 
     async def set_custom_key(self, key: str) -> None:
         """|coro|
@@ -4427,8 +4554,7 @@ class ClientParty(PartyBase, Patchable):
         prop = self.meta.set_custom_key(
             key=key
         )
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(updated=prop)
 
     async def set_fill(self, value: bool) -> None:
         """|coro|
@@ -4452,8 +4578,7 @@ class ClientParty(PartyBase, Patchable):
             raise Forbidden('You have to be leader for this action to work.')
 
         prop = self.meta.set_fill(val=value)
-        if not self.edit_lock.locked():
-            return await self.patch(updated=prop)
+        return await self._maybe_patch(updated=prop)
 
     async def set_max_size(self, size: int) -> None:
         """|coro|
@@ -4488,11 +4613,20 @@ class ClientParty(PartyBase, Patchable):
             'max_size': size
         }
 
-        if not self.edit_lock.locked():
-            return await self.patch(config=config)
-        else:
+        # Inside edit() the config is sent by edit itself.
+        if self.edit_lock.locked():
             self._config_cache.update(config)
 
+        return await self._maybe_patch(config=config)
+
+
+# Very hacky solution but its needed to update the privacy in .config since
+# updating privacy doesnt work as expected when updating with an "all patch"
+# strategy like other props.
+DefaultPartyConfig._META_HOOKS[ClientParty.set_privacy.__qualname__] = (
+    DefaultPartyConfig._update_privacy
+)
+
 
 class ReceivedPartyInvitation:
     """Represents a received party invitation.
@@ -4591,10 +4725,16 @@ class SentPartyInvitation:
         The client.
     party: :class:`Party`
         The party the invitation belongs to.
-    sender: :class:`PartyMember`
-        The party member that sent the invite.
+    sender: Union[:class:`PartyMember`, :class:`User`]
+        The party member that sent the invite. This is a :class:`User`
+        if the sender has left the party since sending the invite.
     receiver: :class:`User`
         The user that the invite was sent to.
+
+        .. warning::
+
+            The display name of this user is ``None`` if the user could not
+            be fetched.
     created_at: :class:`datetime.datetime`
         The UTC time this invite was created at.
     """
@@ -4603,7 +4743,7 @@ class SentPartyInvitation:
 
     def __init__(self, client: 'Client',
                  party: Party,
-                 sender: PartyMember,
+                 sender: Union[PartyMember, User],
                  receiver: User,
                  data: dict) -> None:
         self.client = client
@@ -26,13 +26,29 @@ SOFTWARE.
 
 import asyncio
 import datetime
+import json
 import re
 
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 uuid_match_comp = re.compile(r'^[a-f0-9]{32}$')
 
 
+if orjson is not None:
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    json_loads = orjson.loads
+else:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+
 class MaybeLock:
     def __init__(self, lock: asyncio.Lock,
                  loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
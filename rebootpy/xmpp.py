@@ -26,7 +26,6 @@ SOFTWARE.
 
 import aioxmpp
 import asyncio
-import json
 import logging
 import datetime
 import uuid
@@ -42,7 +41,7 @@ from .party import (Party, PartyJoinRequest, ReceivedPartyInvitation,
                     PartyJoinConfirmation, PlaylistRequest)
 from .presence import Presence
 from .enums import AwayStatus
-from .utils import to_iso, from_iso
+from .utils import to_iso, from_iso, json_dumps, json_loads
 
 if TYPE_CHECKING:
     from .client import Client
@@ -111,7 +110,7 @@ class EventDispatcher:
 
     @classmethod
     def process_event(cls, client: 'Client', raw_body: dict) -> None:
-        body = json.loads(raw_body)
+        body = json_loads(raw_body)
 
         type_ = body.get('type')
         if type_ is None:
@@ -631,7 +630,7 @@ class XMPPClient:
         }
 
         if 'Platform_j' in member_m:
-            meta['Platform_j'] = json.loads(
+            meta['Platform_j'] = json_loads(
                 member_m['Platform_j']
             )['Platform']['platformStr']
 
@@ -1070,7 +1069,7 @@ class XMPPClient:
 
         member._update_connection(body.get('connection'))
         if member.id == self.client.user.id:
-            party.update_presence()
+            party.update_presence(force=True)
 
         self.client.dispatch_event('party_member_reconnect', member)
 
@@ -1138,10 +1137,14 @@ class XMPPClient:
                     value
                 )
 
-        if self.client.auto_update_status and \
-                (_getattr(party, 'playlist_info')[0]
-                 != pre_values['playlist_info'][0]):
-            await self.client.auto_update_status_text()
+        playlist_id = _getattr(party, 'playlist_info')[0]
+        if playlist_id != pre_values['playlist_info'][0]:
+            waiter = party._playlist_waiters.pop(playlist_id, None)
+            if waiter is not None:
+                waiter.set()
+
+            if self.client.auto_update_status:
+                await self.client.auto_update_status_text()
 
     @EventDispatcher.event('com.epicgames.social.party.notification.v0.MEMBER_STATE_UPDATED')  # noqa
     async def event_party_member_state_updated(self,
@@ -1215,7 +1218,7 @@ class XMPPClient:
                 'Default:MemberSquadAssignmentRequest_j'
             )
             if req_j is not None:
-                req = json.loads(req_j)['MemberSquadAssignmentRequest']
+                req = json_loads(req_j)['MemberSquadAssignmentRequest']
                 version = req.get('version')
 
                 if member.id == self.client.user.id:
@@ -1251,7 +1254,7 @@ class XMPPClient:
 
         if (body.get('member_state_updated').get('Default:SuggestedIsland_j')
                 and party.me.leader):
-            island_raw = json.loads(
+            island_raw = json_loads(
                 body['member_state_updated']['Default:SuggestedIsland_j']
             )
 
@@ -1382,7 +1385,7 @@ class XMPPClient:
                                status: str,
                                show: str) -> None:
         try:
-            data = json.loads(status)
+            data = json_loads(status)
 
             ch = data.get('Status', '') != ''
 
@@ -1600,7 +1603,7 @@ class XMPPClient:
                 available=True,
                 show=show
             ),
-            status=json.dumps(_status)
+            status=json_dumps(_status)
         )
 
     async def send_presence(self, to: Optional[aioxmpp.JID] = None,
@@ -1623,7 +1626,7 @@ class XMPPClient:
         )
 
         if _status is not None:
-            pres.status[None] = json.dumps(_status)
+            pres.status[None] = json_dumps(_status)
         await self.stream.send(pres)
 
     async def get_presence(self, jid: aioxmpp.JID) -> Presence:
@@ -21,7 +21,10 @@ extras_require = {
         'sphinxcontrib_trio==1.1.2',
         'furo==2021.4.11b34',
         'Jinja2<3.1',
-    ]
+    ],
+    'speed': [
+        'orjson>=3.6.0',
+    ],
 }
 
 setuptools.setup(